@@ -1,19 +1,30 @@
 """宝可梦AI智能体的主入口点。"""
 
 import os
+
+# 在导入numpy等库之前限制其线程池，避免与PyBoy主循环争抢CPU
+for _var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'NUMBA_NUM_THREADS'):
+    os.environ.setdefault(_var, '1')
+
 import sys
 import time
+import queue
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 # 从.env文件加载环境变量
 from dotenv import load_dotenv
 load_dotenv()
 
 from src.utils.config import get_config
 from src.utils.logger import get_logger
+from src.utils.async_runner import submit
 from src.emulator.game_boy import GameBoyEmulator
 from src.emulator.memory_reader import MemoryReader
 from src.state.game_state import GameState
@@ -57,6 +68,10 @@ class PokemonAIAgent:
         self.turn_count = 0
         self.last_checkpoint_turn = 0
 
+        # 检查点在后台线程写入磁盘，主循环只负责拍摄快照
+        self._ckpt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Checkpoint')
+        self._ckpt_future = None
+
         # 设置信号处理器
         signal.signal(signal.SIGINT, self._signal_handler)
 
@@ -73,6 +88,14 @@ class PokemonAIAgent:
         self.emulator = GameBoyEmulator(rom_path, headless, speed)
         self.memory_reader = MemoryReader(self.emulator)
 
+        # PyBoy的屏幕ndarray是持续更新的视图；推送给可视化线程前复制到
+        # 预分配缓冲区，避免每帧创建PIL图像。空闲缓冲区放在队列中：
+        # 主循环取出后写入，可视化线程用完后归还，两边不会同时持有同一块
+        self._screen_np = self.emulator.get_screen_array()
+        self._free_screen_bufs = queue.Queue()
+        for _ in range(2):
+            self._free_screen_bufs.put(np.empty_like(self._screen_np))
+
         self.logger.info("模拟器初始化完成")
 
     def _init_state_systems(self) -> None:
@@ -82,6 +105,10 @@ class PokemonAIAgent:
         self.vision = VisionProcessor()
         self.map_memory = MapMemory()
 
+        # 预先编译地图扫描内核（Numba可用时在磁盘缓存编译结果）
+        from src.state.map_memory import warm_up_kernels
+        warm_up_kernels()
+
         self.game_state = GameState(
             self.emulator,
             self.memory_reader,
@@ -100,6 +127,9 @@ class PokemonAIAgent:
         self.puzzle_solver = PuzzleSolverAgent()
         self.critic = CriticAgent()
 
+        # 评论在共享事件循环上后台运行，完成后再收集
+        self._critic_future = None
+
         self.logger.info("AI智能体初始化完成")
 
     def _init_tools(self) -> None:
@@ -109,19 +139,40 @@ class PokemonAIAgent:
         self.action_executor = ActionExecutor(self.emulator)
         self.progress_tracker = ProgressTracker()
 
+        # 缓存游戏循环中每回合使用的配置项，避免重复的点路径查找
+        self._cfg_vis_enabled = self.config.get('visualization.enabled', True)
+        self._cfg_async = self.config.get('performance.async_decisions', True)
+        self._cfg_save_screenshots = self.config.get('logging.save_screenshots')
+        self._cfg_checkpoint_interval = self.config.get('progress.checkpoint_interval', 100)
+        self._cfg_screenshot_interval = self.config.get('visualization.screenshot_interval_ms', 66) / 1000.0
+
+        # 输出目录只在初始化时解析和创建一次
+        self._screenshot_dir = Path(self.config.get('logging.screenshot_dir'))
+        self._screenshot_dir.mkdir(parents=True, exist_ok=True)
+        self._checkpoint_root = Path(self.config.get('game.save_state_dir'))
+        self._checkpoint_root.mkdir(parents=True, exist_ok=True)
+
         # 初始化异步决策器以实现非阻塞AI
         self.async_ai = AsyncDecisionMaker(self.main_agent)
-        if self.config.get('performance.async_decisions', True):
+        if self._cfg_async:
             self.async_ai.start()
             self.logger.info("异步AI决策已启用")
 
         # 初始化可视化器
         vis_port = self.config.get('visualization.port', 5000)
-        self.visualizer = GameVisualizer(port=vis_port)
+        self.visualizer = GameVisualizer(port=vis_port,
+                                         batched=self.config.get('visualization.batch_updates', True))
+
+        # 可视化更新在后台线程中处理，主循环只投递最新一帧（旧帧被合并覆盖）
+        self._vis_queue = queue.Queue(maxsize=1)
+        self._vis_thread = None
+        self._last_vis_ts = 0.0
 
         # 如果启用则启动可视化器
-        if self.config.get('visualization.enabled', True):
+        if self._cfg_vis_enabled:
             self.visualizer.start()
+            self._vis_thread = threading.Thread(target=self._visualization_loop, daemon=True)
+            self._vis_thread.start()
             self.logger.info(f"可视化仪表板可访问：http://localhost:{vis_port}")
 
         self.logger.info("工具初始化完成")
@@ -132,7 +183,7 @@ class PokemonAIAgent:
         self.logger.milestone("开始游戏")
 
         try:
-            while self.running and self.emulator.is_running():
+            while self.running:
                 self._game_loop_iteration()
 
         except KeyboardInterrupt:
@@ -146,36 +197,50 @@ class PokemonAIAgent:
         """游戏循环的单次迭代，使用异步AI以保持PyBoy响应。"""
         self.turn_count += 1
 
+        # 收集已完成的后台评论
+        self._collect_critique()
+
         # 更新游戏状态
         current_state = self.game_state.update()
         state_text = self.game_state.get_text_representation(current_state)
 
-        # 使用当前状态更新可视化器
-        if self.config.get('visualization.enabled', True):
-            self.visualizer.update_state(current_state)
-            # 每回合更新截图以实现实时显示
-            screen_image = self.emulator.get_screen_image()
-            self.visualizer.update_screenshot(screen_image)
+        # 使用当前状态更新可视化器（由后台线程完成编码和推送）
+        if self._cfg_vis_enabled:
+            goals = None
             # 从主智能体更新目标
             if hasattr(self.main_agent, 'goal_manager') and self.main_agent.goal_manager:
                 goals = self.main_agent.goal_manager.get_all_goals()
-                self.visualizer.update_goals(goals)
+            # 截图按时间节流（默认约15fps），状态和目标每回合更新
+            screen_image = None
+            now = time.monotonic()
+            if now - self._last_vis_ts > self._cfg_screenshot_interval:
+                # 缓冲区都还在编码中时跳过本帧，下回合再试
+                try:
+                    screen_image = self._free_screen_bufs.get_nowait()
+                except queue.Empty:
+                    pass
+                else:
+                    np.copyto(screen_image, self._screen_np)
+                    self._last_vis_ts = now
+            self._publish_visualization(state=current_state,
+                                        screen=screen_image,
+                                        goals=goals)
 
         # 定期记录状态
         if self.turn_count % 10 == 0:
-            self.logger.info(f"\n{state_text}")
+            self.logger.info("\n%s", state_text)
 
         # 更新进度
         self.progress_tracker.update(self.turn_count, current_state)
 
         # 如果启用则保存截图
-        if self.config.get('logging.save_screenshots') and self.turn_count % 50 == 0:
+        if self._cfg_save_screenshots and self.turn_count % 50 == 0:
             self._save_screenshot()
 
         # 检查是否卡住
         if self.action_executor.is_stuck():
             self.logger.warning("智能体似乎卡住了 - 请求评论者评估")
-            if self.config.get('visualization.enabled', True):
+            if self._cfg_vis_enabled:
                 self.visualizer.log_event('error', '智能体卡住 - 请求评论者评估')
             self._handle_stuck_state(current_state)
             self.action_executor.reset_stuck_detection()
@@ -184,29 +249,73 @@ class PokemonAIAgent:
         decision = self._get_ai_decision_responsive(current_state, state_text)
 
         # 使用决策更新可视化器
-        if self.config.get('visualization.enabled', True):
+        if self._cfg_vis_enabled:
             action = decision.get('action', 'wait')
             reasoning = decision.get('reasoning', '')
-            self.visualizer.update_decision(action, reasoning, self.turn_count)
+            self._publish_visualization(decision=(action, reasoning, self.turn_count))
 
         # 执行行动
         action = decision.get('action', 'wait')
         success = self.action_executor.execute(action)
 
         if not success:
-            self.logger.warning(f"行动失败: {action}")
+            self.logger.warning("行动失败: %s", action)
 
         # 定期保存检查点
-        checkpoint_interval = self.config.get('progress.checkpoint_interval', 100)
-        if self.turn_count - self.last_checkpoint_turn >= checkpoint_interval:
-            if self.config.get('visualization.enabled', True):
+        if self.turn_count - self.last_checkpoint_turn >= self._cfg_checkpoint_interval:
+            if self._cfg_vis_enabled:
                 self.visualizer.log_event('milestone', f'回合{self.turn_count}已保存检查点')
-            self._save_checkpoint()
+            self._save_checkpoint_async()
             self.last_checkpoint_turn = self.turn_count
 
         # Tick模拟器
         self.emulator.tick(10)
 
+    def _publish_visualization(self, **frame) -> None:
+        """投递一帧可视化数据，永不阻塞主循环。
+
+        参数:
+            frame: 可包含state、screen、goals、decision字段
+        """
+        # 只有主循环会投递，因此取出未消费的旧帧后一定能放入新帧
+        try:
+            stale = self._vis_queue.get_nowait()
+        except queue.Empty:
+            stale = None
+
+        if stale:
+            # 被新截图替换的旧缓冲区不会再被使用，直接归还
+            if frame.get('screen') is not None and stale.get('screen') is not None:
+                self._free_screen_bufs.put(stale['screen'])
+            frame = {**stale, **{k: v for k, v in frame.items() if v is not None}}
+
+        self._vis_queue.put_nowait(frame)
+
+    def _visualization_loop(self) -> None:
+        """后台线程：消费可视化帧并推送到仪表板。"""
+        while True:
+            frame = self._vis_queue.get()
+            if frame is None:  # 关闭信号
+                break
+
+            try:
+                if frame.get('state') is not None:
+                    self.visualizer.update_state(frame['state'])
+                if frame.get('screen') is not None:
+                    try:
+                        self.visualizer.update_screenshot(frame['screen'])
+                    finally:
+                        # 可视化器会编码或复制截图，返回后缓冲区即可归还主循环
+                        self._free_screen_bufs.put(frame['screen'])
+                if frame.get('goals') is not None:
+                    self.visualizer.update_goals(frame['goals'])
+                if frame.get('decision') is not None:
+                    self.visualizer.update_decision(*frame['decision'])
+                # 每帧的所有更新合并为一次推送
+                self.visualizer.flush()
+            except Exception as e:
+                self.logger.error("可视化更新失败: %s", e)
+
     def _get_ai_decision_responsive(self, current_state: dict, state_text: str) -> dict:
         """在保持PyBoy窗口响应的同时获取AI决策。
 
@@ -217,9 +326,7 @@ class PokemonAIAgent:
         返回:
             包含行动和推理的决策字典
         """
-        use_async = self.config.get('performance.async_decisions', True)
-
-        if not use_async or not hasattr(self, 'async_ai'):
+        if not self._cfg_async or not hasattr(self, 'async_ai'):
             # 回退到同步模式（会阻塞）
             return self.main_agent.decide_action(current_state, state_text)
 
@@ -228,21 +335,19 @@ class PokemonAIAgent:
 
         # 等待决策的同时保持PyBoy响应
         max_wait_time = 60.0  # 最多60秒
-        start_time = time.time()
+        deadline = time.monotonic() + max_wait_time
         tick_interval = 0.1  # 每100ms tick一次PyBoy
 
-        while time.time() - start_time < max_wait_time:
-            # 检查决策是否准备好
-            decision = self.async_ai.get_decision(timeout=0.0)
-            if decision:
-                return decision
+        while time.monotonic() < deadline:
+            # 决策就绪时立即唤醒，而不是轮询休眠
+            if self.async_ai.decision_event.wait(timeout=tick_interval):
+                decision = self.async_ai.get_decision()
+                if decision:
+                    return decision
 
             # 通过tick保持PyBoy响应
             self.emulator.tick(6)  # 60fps时约100ms
 
-            # 短暂休眠以防止CPU空转
-            time.sleep(0.05)
-
         # 超时 - 返回等待行动
         self.logger.warning("AI决策超时 - 使用默认等待行动")
         return {'action': 'wait', 'reasoning': '决策超时'}
@@ -251,56 +356,111 @@ class PokemonAIAgent:
     def _handle_stuck_state(self, current_state: dict) -> None:
         """处理智能体卡住的情况。
 
+        评论请求在后台执行，主智能体可以继续决策。
+
         参数:
             current_state: 当前游戏状态
         """
+        if self._critic_future and not self._critic_future.done():
+            return  # 上一次评论仍在进行
+
         # 获取最近的行动历史
         history = self.action_executor.get_action_history(20)
         history_text = f"最近的行动: {', '.join(history)}"
 
-        # 获取评论
-        critique = self.critic.critique(history_text, current_state)
+        # 异步获取评论
+        self._critic_future = submit(self.critic.acritique(history_text, current_state))
+
+    def _collect_critique(self) -> None:
+        """如果后台评论已完成，则记录并交给主智能体。"""
+        if not self._critic_future or not self._critic_future.done():
+            return
+
+        future, self._critic_future = self._critic_future, None
+        try:
+            critique = future.result()
+        except Exception as e:
+            self.logger.error("评论者评估失败: %s", e)
+            return
 
-        self.logger.info(f"评论者评估: {critique['assessment']}")
-        self.logger.info(f"评论者问题: {critique['issues']}")
-        self.logger.info(f"评论者建议: {critique['suggestions']}")
+        self.logger.info("评论者评估: %s", critique['assessment'])
+        self.logger.info("评论者问题: %s", critique['issues'])
+        self.logger.info("评论者建议: %s", critique['suggestions'])
 
-        # 可以使用评论来调整策略
-        # 目前只记录日志
+        # 将评论加入下一次决策的提示
+        self.main_agent.add_critique(critique)
 
     def _save_screenshot(self) -> None:
         """保存带注释的截图。"""
-        screenshot_dir = Path(self.config.get('logging.screenshot_dir'))
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-
-        filename = screenshot_dir / f"turn_{self.turn_count:06d}.png"
+        filename = self._screenshot_dir / f"turn_{self.turn_count:06d}.png"
 
         screen = self.emulator.get_screen_image()
         self.vision.save_annotated_screenshot(screen, str(filename))
 
     def _save_checkpoint(self) -> None:
-        """保存检查点。"""
-        self.logger.info(f"正在保存回合{self.turn_count}的检查点")
+        """同步保存检查点。"""
+        self._write_checkpoint(self.turn_count, *self._snapshot_checkpoint())
+
+    def _save_checkpoint_async(self) -> None:
+        """拍摄检查点快照并在后台线程中写入磁盘。"""
+        if self._ckpt_future is not None and not self._ckpt_future.done():
+            self.logger.warning("上一个检查点仍在保存 - 跳过本次检查点")
+            return
+
+        # 快照必须在主线程中拍摄：模拟器不是线程安全的，地图记忆、上下文和目标每回合都在变化
+        snapshot = self._snapshot_checkpoint()
+        self._ckpt_future = self._ckpt_executor.submit(self._write_checkpoint, self.turn_count, *snapshot)
 
-        checkpoint_dir = Path(self.config.get('game.save_state_dir')) / f"checkpoint_{self.turn_count}"
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    def _snapshot_checkpoint(self) -> tuple:
+        """捕获检查点数据的副本。
+
+        所有状态都在此处复制为普通数据，后台线程只负责文件写入。
+
+        返回:
+            (模拟器状态字节, 智能体数据, 地图记忆数据, 进度数据, 进度摘要)
+        """
+        checkpoint_dir = self._checkpoint_root / f"checkpoint_{self.turn_count}"
+        return (
+            self.emulator.get_state_bytes(),
+            self.main_agent.snapshot_state(str(checkpoint_dir)),
+            self.map_memory.snapshot(),
+            self.progress_tracker.snapshot(),
+            self.progress_tracker.get_progress_summary(),
+        )
+
+    def _write_checkpoint(self, turn: int, emulator_state: bytes, agent_data: dict,
+                          map_data: dict, progress_data: dict, progress_summary: str) -> None:
+        """将检查点快照写入磁盘。
+
+        参数:
+            turn: 快照所属回合
+            emulator_state: 模拟器状态字节
+            agent_data: 智能体（上下文和目标）快照
+            map_data: 地图记忆快照
+            progress_data: 进度快照
+            progress_summary: 进度摘要文本
+        """
+        self.logger.info("正在保存回合%d的检查点", turn)
+
+        checkpoint_dir = self._checkpoint_root / f"checkpoint_{turn}"
+        checkpoint_dir.mkdir(exist_ok=True)
 
         # 保存模拟器状态
-        self.emulator.save_state(str(checkpoint_dir / "emulator.state"))
+        (checkpoint_dir / "emulator.state").write_bytes(emulator_state)
 
         # 保存智能体状态
-        self.main_agent.save_state(str(checkpoint_dir))
+        self.main_agent.save_state(str(checkpoint_dir), agent_data)
 
         # 保存地图记忆
-        self.map_memory.save()
+        self.map_memory.save(map_data)
 
         # 保存进度
-        self.progress_tracker.save(str(checkpoint_dir / "progress.json"))
+        self.progress_tracker.save(str(checkpoint_dir / "progress.json"), progress_data)
 
-        self.logger.info(f"检查点已保存到 {checkpoint_dir}")
+        self.logger.info("检查点已保存到 %s", checkpoint_dir)
 
         # 打印进度摘要
-        self.logger.info("\n" + self.progress_tracker.get_progress_summary())
+        self.logger.info("\n%s", progress_summary)
 
     def _signal_handler(self, sig, frame) -> None:
         """处理中断信号。"""
@@ -315,10 +475,20 @@ class PokemonAIAgent:
         if hasattr(self, 'async_ai'):
             self.async_ai.stop()
 
-        # 保存最终检查点
+        # 等待后台检查点完成后保存最终检查点
+        self._ckpt_executor.shutdown(wait=True)
         self._save_checkpoint()
+        self.map_memory.close()
+
+        # 停止可视化线程和可视化器
+        if getattr(self, '_vis_thread', None):
+            try:
+                self._vis_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._vis_queue.put(None)
+            self._vis_thread.join(timeout=5.0)
 
-        # 停止可视化器
         if hasattr(self, 'visualizer'):
             self.visualizer.stop()
 
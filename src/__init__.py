@@ -1,12 +1,16 @@
 """Source package for Pokemon AI Agent."""
 
-__version__ = '1.0.0'
+import importlib
 
-from . import emulator
-from . import state
-from . import agents
-from . import memory
-from . import tools
-from . import utils
+__version__ = '1.0.0'
 
 __all__ = ['emulator', 'state', 'agents', 'memory', 'tools', 'utils']
+
+
+def __getattr__(name):
+    """Import subpackages on first access (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
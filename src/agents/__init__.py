@@ -1,8 +1,22 @@
 """AI agent modules."""
 
-from .main_agent import MainAgent
-from .pathfinder import PathfinderAgent
-from .puzzle_solver import PuzzleSolverAgent
-from .critic import CriticAgent
+import importlib
+
+# Exported name -> submodule; imported on first access (PEP 562)
+_EXPORTS = {
+    'MainAgent': '.main_agent',
+    'PathfinderAgent': '.pathfinder',
+    'PuzzleSolverAgent': '.puzzle_solver',
+    'CriticAgent': '.critic',
+}
 
 __all__ = ['MainAgent', 'PathfinderAgent', 'PuzzleSolverAgent', 'CriticAgent']
+
+
+def __getattr__(name):
+    """Import agent classes on first access."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,6 @@
 """Async AI decision wrapper for non-blocking gameplay."""
 
 import threading
-import queue
-import time
 from typing import Dict, Any, Optional
 from ..utils.logger import get_logger
 
@@ -19,9 +17,13 @@ class AsyncDecisionMaker:
         self.main_agent = main_agent
         self.logger = get_logger('AsyncAI')
 
-        # Thread communication
-        self.request_queue = queue.Queue(maxsize=1)
-        self.result_queue = queue.Queue(maxsize=1)
+        # Thread communication: single request/result slots, newest wins.
+        # The lock is only held to swap a slot; events signal a filled slot.
+        self._lock = threading.Lock()
+        self._req = None
+        self._res = None
+        self._req_event = threading.Event()
+        self._res_event = threading.Event()
         self.worker_thread = None
         self.running = False
 
@@ -45,10 +47,15 @@ class AsyncDecisionMaker:
         while self.running:
             try:
                 # Wait for a decision request (blocking with timeout)
-                request = self.request_queue.get(timeout=1.0)
+                if not self._req_event.wait(timeout=1.0):
+                    continue
+
+                with self._lock:
+                    request, self._req = self._req, None
+                    self._req_event.clear()
 
                 if request is None:  # Shutdown signal
-                    break
+                    continue
 
                 self.is_thinking = True
                 current_state, state_text = request
@@ -56,23 +63,31 @@ class AsyncDecisionMaker:
                 # Make decision (this is the slow part)
                 try:
                     decision = self.main_agent.decide_action(current_state, state_text)
-                    self.result_queue.put(decision)
+                    self._set_result(decision)
                     self.last_decision = decision
                 except Exception as e:
                     self.logger.error(f"Error in decision making: {e}", exc_info=True)
                     # Put a default "wait" decision on error
-                    self.result_queue.put({'action': 'wait', 'reasoning': f'Error: {str(e)}'})
+                    self._set_result({'action': 'wait', 'reasoning': f'Error: {str(e)}'})
 
                 self.is_thinking = False
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 self.logger.error(f"Worker thread error: {e}", exc_info=True)
                 self.is_thinking = False
 
         self.logger.info("Worker thread stopped")
 
+    def _set_result(self, decision: Dict[str, Any]) -> None:
+        """Publish a decision, replacing any unread one.
+
+        Args:
+            decision: Decision dict
+        """
+        with self._lock:
+            self._res = decision
+            self._res_event.set()
+
     def request_decision(self, current_state: Dict[str, Any], state_text: str) -> bool:
         """Request a decision asynchronously.
 
@@ -86,18 +101,18 @@ class AsyncDecisionMaker:
         if self.is_thinking:
             return False  # Already processing a decision
 
-        try:
-            # Clear any old requests
-            try:
-                self.request_queue.get_nowait()
-            except queue.Empty:
-                pass
-
-            # Queue the new request
-            self.request_queue.put((current_state, state_text), block=False)
+        # A planned action for this state skips the API call entirely
+        cached = self.main_agent.pop_cached_decision(current_state)
+        if cached:
+            self._set_result(cached)
+            self.last_decision = cached
             return True
-        except queue.Full:
-            return False
+
+        # Replace any request the worker hasn't picked up yet
+        with self._lock:
+            self._req = (current_state, state_text)
+            self._req_event.set()
+        return True
 
     def get_decision(self, timeout: float = 0.0) -> Optional[Dict[str, Any]]:
         """Get a decision if ready.
@@ -108,18 +123,30 @@ class AsyncDecisionMaker:
         Returns:
             Decision dict if ready, None otherwise
         """
-        try:
-            return self.result_queue.get(timeout=timeout)
-        except queue.Empty:
+        if timeout > 0:
+            self._res_event.wait(timeout)
+
+        # Lock-free check so non-blocking polls stay cheap
+        if not self._res_event.is_set():
             return None
 
+        with self._lock:
+            decision, self._res = self._res, None
+            self._res_event.clear()
+        return decision
+
+    @property
+    def decision_event(self) -> threading.Event:
+        """Event that is set while a decision is waiting to be collected."""
+        return self._res_event
+
     def is_ready(self) -> bool:
         """Check if a decision is ready.
 
         Returns:
             True if decision is available
         """
-        return not self.result_queue.empty()
+        return self._res_event.is_set()
 
     def stop(self):
         """Stop the worker thread."""
@@ -127,7 +154,7 @@ class AsyncDecisionMaker:
             return
 
         self.running = False
-        self.request_queue.put(None)  # Shutdown signal
+        self._req_event.set()  # Wake the worker so it sees the shutdown
 
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=5.0)
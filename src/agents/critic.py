@@ -1,10 +1,15 @@
 """Critic agent for evaluating strategy and decisions."""
 
+import re
 from typing import Dict, Any, List
-from anthropic import Anthropic
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from ..utils.anthropic_client import get_client
+from ..utils.async_runner import run_sync
+
+# Section headers in the critique; bodies run until the next header
+_SECTION_RE = re.compile(r'^[ \t]*(ASSESSMENT|ISSUES|SUGGESTIONS):', re.MULTILINE)
 
 
 class CriticAgent:
@@ -32,13 +37,8 @@ SUGGESTIONS: <concrete suggestions for improvement>
         self.logger = get_logger('Critic')
         self.config = get_config()
 
-        # Initialize AI client with custom base_url if provided
-        import os
-        base_url = os.getenv('ANTHROPIC_BASE_URL')
-        if base_url:
-            self.client = Anthropic(base_url=base_url)
-        else:
-            self.client = Anthropic()
+        # All agents share one client and HTTP/2 keep-alive pool
+        self.client = get_client()
 
         self.model = self.config.get('ai.agents.critic.model')
         self.temperature = self.config.get('ai.agents.critic.temperature')
@@ -46,8 +46,22 @@ SUGGESTIONS: <concrete suggestions for improvement>
         self.logger.info("Critic agent initialized")
 
     def critique(self, recent_history: str, current_state: Dict[str, Any]) -> Dict[str, str]:
+        """Blocking counterpart of acritique for synchronous callers.
+
+        Args:
+            recent_history: Recent action history
+            current_state: Current game state
+
+        Returns:
+            Dict with assessment, issues, suggestions
+        """
+        return run_sync(self.acritique(recent_history, current_state))
+
+    async def acritique(self, recent_history: str, current_state: Dict[str, Any]) -> Dict[str, str]:
         """Provide critique of recent performance.
 
+        Must run on the shared event loop (see utils.async_runner).
+
         Args:
             recent_history: Recent action history
             current_state: Current game state
@@ -69,7 +83,7 @@ Current state:
 Provide your critique."""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=1500,
                 temperature=self.temperature,
@@ -102,27 +116,13 @@ Provide your critique."""
         Returns:
             Critique dict
         """
-        critique = {
-            'assessment': '',
-            'issues': '',
-            'suggestions': ''
-        }
-
-        current_section = None
-
-        for line in response.split('\n'):
-            line = line.strip()
-
-            if line.startswith('ASSESSMENT:'):
-                current_section = 'assessment'
-                critique['assessment'] = line.replace('ASSESSMENT:', '').strip()
-            elif line.startswith('ISSUES:'):
-                current_section = 'issues'
-                critique['issues'] = line.replace('ISSUES:', '').strip()
-            elif line.startswith('SUGGESTIONS:'):
-                current_section = 'suggestions'
-                critique['suggestions'] = line.replace('SUGGESTIONS:', '').strip()
-            elif current_section and line:
-                critique[current_section] += ' ' + line
-
-        return critique
+        # Words per section; joined once at the end. Repeated headers extend
+        # their section instead of replacing it.
+        buf = {'assessment': [], 'issues': [], 'suggestions': []}
+
+        matches = list(_SECTION_RE.finditer(response))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(response)
+            buf[match.group(1).lower()].extend(response[match.end():end].split())
+
+        return {section: ' '.join(words) for section, words in buf.items()}
@@ -1,14 +1,23 @@
 """Main AI agent for Pokemon Red."""
 
-from typing import Dict, Any, Optional, List
-from anthropic import Anthropic
+import re
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from ..utils.anthropic_client import get_client, BASE_URL
+from ..utils.async_runner import run_sync
 from ..memory.context_manager import ContextManager
 from ..memory.summarizer import Summarizer
 from ..tools.goal_manager import GoalManager
 
+# Section headers in the agent's response; bodies run until the next header
+_SECTION_RE = re.compile(r'^[ \t]*(REASONING|ACTION|PLAN|GOAL_UPDATE):[ \t]*', re.MULTILINE)
+
+# A complete ACTION line; once streamed, the decision can be acted on
+_ACTION_LINE_RE = re.compile(r'^[ \t]*ACTION:[^\n]*\n', re.MULTILINE)
+
 
 class MainAgent:
     """Primary AI agent that makes gameplay decisions."""
@@ -40,35 +49,66 @@ Guidelines:
 Your response should be in this format:
 REASONING: <your analysis of the situation and decision-making process>
 ACTION: <single action to take>
+PLAN: <comma-separated follow-up actions for the next turns if everything goes as expected, or "none">
 GOAL_UPDATE: <any goal updates needed, or "none">
 
 Example response:
 REASONING: I'm in Pallet Town and need to reach Professor Oak's lab to get my first Pokemon. The lab is north of my current position.
 ACTION: up
+PLAN: up,up,right
 GOAL_UPDATE: none
 """
 
+    # Position change caused by each movement action, used to predict lookahead states
+    MOVE_DELTAS = {
+        'up': (0, -1),
+        'down': (0, 1),
+        'left': (-1, 0),
+        'right': (1, 0),
+    }
+
     def __init__(self):
         """Initialize main agent."""
         self.logger = get_logger('MainAgent')
         self.config = get_config()
 
-        # Initialize AI client with custom base_url if provided
-        import os
-        base_url = os.getenv('ANTHROPIC_BASE_URL')
-        if base_url:
-            self.client = Anthropic(base_url=base_url)
-            self.logger.info(f"Using custom API endpoint: {base_url}")
-        else:
-            self.client = Anthropic()
+        # All agents share one client and HTTP/2 keep-alive pool
+        self.client = get_client()
+        if BASE_URL:
+            self.logger.info(f"Using custom API endpoint: {BASE_URL}")
 
         self.model = self.config.get('ai.agents.main.model')
         self.temperature = self.config.get('ai.agents.main.temperature')
 
+        # Speculative lookahead: one API call plans the next N actions, cached
+        # by the state each planned action is expected to be taken in
+        self.lookahead = self.config.get('ai.agents.main.lookahead', 3)
+        self._decision_cache: Dict[Tuple, Dict[str, Any]] = {}
+
+        # Approximate token budget for the context part of each prompt
+        self.context_token_budget = self.config.get('ai.agents.main.context_token_budget')
+
+        # Fixed request parameters, built once
+        self.max_tokens = self.config.get('ai.max_tokens', 4096) + 64 * self.lookahead
+        self._decision_request = "\nBased on the above information, decide your next action."
+        if self.lookahead > 0:
+            self._decision_request += (
+                f"\n\nAlso list up to {self.lookahead} follow-up actions in PLAN."
+            )
+
+        # Rest of the streamed response still being read after the action was returned
+        self._stream_tail: Optional[asyncio.Task] = None
+
+        # Critic feedback to include in the next prompt
+        self.pending_critique: Optional[Dict[str, str]] = None
+
         # Sub-components
         self.context = ContextManager(
             max_turns=self.config.get('memory.max_context_turns', 100),
-            keep_recent=self.config.get('memory.keep_recent_turns', 20)
+            keep_recent=self.config.get('memory.keep_recent_turns', 20),
+            serializer=self.config.get('memory.context_serializer', 'json'),
+            # One turn log for all checkpoints; each records its offset into it
+            turn_log=f"{self.config.get('game.save_state_dir', 'data/checkpoints')}/context"
         )
         self.summarizer = Summarizer()
         self.goals = GoalManager()
@@ -82,8 +122,22 @@ GOAL_UPDATE: none
         self.logger.info("Main agent initialized")
 
     def decide_action(self, game_state: Dict[str, Any], state_text: str) -> Dict[str, Any]:
+        """Blocking counterpart of adecide_action for synchronous callers.
+
+        Args:
+            game_state: Game state dict
+            state_text: Text representation of state
+
+        Returns:
+            Decision dict with action, reasoning, etc.
+        """
+        return run_sync(self.adecide_action(game_state, state_text))
+
+    async def adecide_action(self, game_state: Dict[str, Any], state_text: str) -> Dict[str, Any]:
         """Decide next action based on game state.
 
+        Must run on the shared event loop (see utils.async_runner).
+
         Args:
             game_state: Game state dict
             state_text: Text representation of state
@@ -93,43 +147,37 @@ GOAL_UPDATE: none
         """
         turn = game_state['turn']
 
+        # Let the previous response finish so its plan and goal update apply
+        await self._finish_stream_tail()
+
+        # Reuse a planned action if this state was predicted by the last call
+        cached = self.pop_cached_decision(game_state)
+        if cached:
+            return cached
+
         # Check if we need summarization
         if self.context.needs_summarization():
             self.logger.info("Triggering context summarization")
-            self._summarize_context()
+            await self._summarize_context()
 
         # Build prompt
         prompt = self._build_prompt(game_state, state_text)
 
-        # Get AI response
+        # Get AI response. The response is streamed and the decision returned as
+        # soon as the ACTION line is complete; PLAN and GOAL_UPDATE are applied
+        # when the rest of the stream arrives.
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.config.get('ai.max_tokens', 4096),
-                temperature=self.temperature,
-                system=self.SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}]
+            action_ready = asyncio.get_running_loop().create_future()
+            self._stream_tail = asyncio.ensure_future(
+                self._complete_response(prompt, game_state, action_ready)
             )
 
-            response_text = response.content[0].text
-
             # Parse response
-            decision = self._parse_response(response_text)
+            decision = self._parse_response(await action_ready)
+            decision['plan'] = []
+            decision['goal_update'] = None
 
-            # Log decision
-            self.logger.decision(decision['action'], decision['reasoning'])
-
-            # Add to context
-            self.context.add_turn(
-                turn_number=turn,
-                state=game_state,
-                action=decision['action'],
-                reasoning=decision['reasoning']
-            )
-
-            # Update goals if needed
-            if decision.get('goal_update') and decision['goal_update'] != 'none':
-                self._process_goal_update(decision['goal_update'])
+            self._record_decision(turn, game_state, decision)
 
             return decision
 
@@ -142,6 +190,72 @@ GOAL_UPDATE: none
                 'goal_update': None
             }
 
+    async def _stream_response(self, prompt: str, action_ready: asyncio.Future) -> str:
+        """Stream a response, resolving action_ready once the ACTION line is in.
+
+        Args:
+            prompt: User prompt
+            action_ready: Future set to the text received so far
+
+        Returns:
+            Full response text
+        """
+        chunks = []
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                system=self.SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    chunks.append(chunk)
+                    # Only a newline can complete the ACTION line
+                    if not action_ready.done() and '\n' in chunk:
+                        text = "".join(chunks)
+                        if _ACTION_LINE_RE.search(text):
+                            action_ready.set_result(text)
+        except Exception as e:
+            if not action_ready.done():
+                action_ready.set_exception(e)
+            raise
+
+        text = "".join(chunks)
+        if not action_ready.done():
+            action_ready.set_result(text)
+        return text
+
+    async def _complete_response(self, prompt: str, game_state: Dict[str, Any],
+                                 action_ready: asyncio.Future) -> None:
+        """Stream a response and apply its plan and goal update at the end.
+
+        Args:
+            prompt: User prompt
+            game_state: State the decision is made in
+            action_ready: Future resolved early with the partial response
+        """
+        decision = self._parse_response(await self._stream_response(prompt, action_ready))
+
+        # Cache planned follow-up actions for the predicted next states
+        self._cache_plan(game_state, decision)
+
+        # Update goals if needed
+        if decision.get('goal_update') and decision['goal_update'] != 'none':
+            self._process_goal_update(decision['goal_update'])
+
+    async def _finish_stream_tail(self) -> None:
+        """Wait for the previous streamed response to finish."""
+        tail, self._stream_tail = self._stream_tail, None
+        if tail is None:
+            return
+
+        try:
+            await tail
+        except Exception as e:
+            # Errors before the action was ready were already reported
+            self.logger.debug("Response stream ended with error: %s", e)
+
     def _build_prompt(self, game_state: Dict[str, Any], state_text: str) -> str:
         """Build prompt for AI.
 
@@ -155,18 +269,29 @@ GOAL_UPDATE: none
         parts = []
 
         # Add context (summaries + recent turns)
-        context = self.context.get_context_for_ai()
+        context = self.context.get_context_for_ai(max_tokens=self.context_token_budget)
         if context:
             parts.append(context)
 
         # Add current goals
         parts.append(self.goals.get_goals_text())
 
+        # Add critic feedback once, on the first prompt after it arrives
+        if self.pending_critique:
+            critique = self.pending_critique
+            self.pending_critique = None
+            parts.append(
+                "=== CRITIC FEEDBACK ===\n"
+                f"Assessment: {critique['assessment']}\n"
+                f"Issues: {critique['issues']}\n"
+                f"Suggestions: {critique['suggestions']}"
+            )
+
         # Add current state
         parts.append(state_text)
 
         # Add decision request
-        parts.append("\nBased on the above information, decide your next action.")
+        parts.append(self._decision_request)
 
         return "\n\n".join(parts)
 
@@ -179,35 +304,144 @@ GOAL_UPDATE: none
         Returns:
             Parsed decision dict
         """
-        lines = response.strip().split('\n')
+        sections = {}
+        matches = list(_SECTION_RE.finditer(response))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(response)
+            sections[match.group(1)] = response[match.end():end].strip()
+
+        reasoning = sections.get('REASONING', '')
+        action = sections.get('ACTION', '').partition('\n')[0].strip().lower() or 'wait'
 
-        reasoning = ""
-        action = "wait"
-        goal_update = None
+        plan = []
+        plan_text = sections.get('PLAN', '').partition('\n')[0].strip().lower()
+        if plan_text and plan_text != 'none':
+            plan = [a.strip() for a in plan_text.split(',') if a.strip()]
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith('REASONING:'):
-                reasoning = line.replace('REASONING:', '').strip()
-            elif line.startswith('ACTION:'):
-                action = line.replace('ACTION:', '').strip().lower()
-            elif line.startswith('GOAL_UPDATE:'):
-                goal_update = line.replace('GOAL_UPDATE:', '').strip()
+        goal_update = sections.get('GOAL_UPDATE', '').partition('\n')[0].strip() or None
 
         return {
             'reasoning': reasoning,
             'action': action,
+            'plan': plan[:self.lookahead],
             'goal_update': goal_update if goal_update != 'none' else None
         }
 
-    def _summarize_context(self) -> None:
+    def _record_decision(self, turn: int, game_state: Dict[str, Any],
+                         decision: Dict[str, Any]) -> None:
+        """Log a decision and add it to context.
+
+        Args:
+            turn: Turn number
+            game_state: Game state the decision was made in
+            decision: Decision dict
+        """
+        self.logger.decision(decision['action'], decision['reasoning'])
+
+        self.context.add_turn(
+            turn_number=turn,
+            state=game_state,
+            action=decision['action'],
+            reasoning=decision['reasoning']
+        )
+
+    def _state_signature(self, game_state: Dict[str, Any]) -> Tuple:
+        """Get the parts of a state that a planned action depends on.
+
+        Args:
+            game_state: Game state dict
+
+        Returns:
+            Hashable state signature
+        """
+        memory = game_state.get('memory', {})
+        position = memory.get('position', {})
+        return (
+            position.get('map_id'),
+            position.get('x'),
+            position.get('y'),
+            bool(memory.get('in_battle', False)),
+            tuple(game_state.get('visual', {}).get('elements', [])),
+        )
+
+    def _predict_signature(self, signature: Tuple, action: str) -> Optional[Tuple]:
+        """Predict the state signature after taking an action.
+
+        Args:
+            signature: Current state signature
+            action: Action to apply
+
+        Returns:
+            Predicted signature, or None if the outcome can't be predicted locally
+        """
+        map_id, x, y, in_battle, elements = signature
+        delta = self.MOVE_DELTAS.get(action)
+
+        # Only plain overworld movement has a predictable outcome
+        if delta is None or in_battle or elements or x is None or y is None:
+            return None
+
+        return (map_id, x + delta[0], y + delta[1], in_battle, elements)
+
+    def _cache_plan(self, game_state: Dict[str, Any], decision: Dict[str, Any]) -> None:
+        """Cache planned follow-up actions keyed by their predicted states.
+
+        Args:
+            game_state: State the decision was made in
+            decision: Parsed decision with optional plan
+        """
+        self._decision_cache.clear()
+
+        current = self._state_signature(game_state)
+        seen = {current}
+        signature = self._predict_signature(current, decision['action'])
+
+        for step, action in enumerate(decision.get('plan', []), 1):
+            if signature is None or signature in seen:
+                break
+            seen.add(signature)
+            self._decision_cache[signature] = {
+                'action': action,
+                'reasoning': f"Planned step {step}: {decision['reasoning']}",
+                'plan': [],
+                'goal_update': None,
+            }
+            signature = self._predict_signature(signature, action)
+
+    def pop_cached_decision(self, game_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Take a planned decision for this state if one was cached.
+
+        Args:
+            game_state: Current game state
+
+        Returns:
+            Decision dict, or None on cache miss
+        """
+        decision = self._decision_cache.pop(self._state_signature(game_state), None)
+        if decision is None:
+            return None
+
+        self._record_decision(game_state['turn'], game_state, decision)
+        return decision
+
+    def add_critique(self, critique: Dict[str, str]) -> None:
+        """Queue critic feedback for the next decision.
+
+        Args:
+            critique: Dict with assessment, issues, suggestions
+        """
+        self.pending_critique = critique
+        # Plans made before the critique shouldn't bypass it
+        self._decision_cache.clear()
+
+    async def _summarize_context(self) -> None:
         """Summarize context to manage memory."""
         turns_to_summarize = self.context.get_turns_for_summarization()
 
         if not turns_to_summarize:
             return
 
-        summary = self.summarizer.summarize_turns(turns_to_summarize)
+        summary = await self.summarizer.asummarize_turns(turns_to_summarize)
 
         start_turn = turns_to_summarize[0].turn_number
         end_turn = turns_to_summarize[-1].turn_number
@@ -232,14 +466,31 @@ GOAL_UPDATE: none
             goal = update_text.replace('TERTIARY:', '').strip()
             self.goals.set_tertiary_goal(goal)
 
-    def save_state(self, directory: str) -> None:
+    def snapshot_state(self, directory: str) -> Dict[str, Any]:
+        """Copy agent state into plain data for save_state().
+
+        Args:
+            directory: Directory the snapshot will be saved to
+
+        Returns:
+            Context and goal snapshots
+        """
+        return {
+            'context': self.context.snapshot(f"{directory}/context.json"),
+            'goals': self.goals.snapshot(),
+        }
+
+    def save_state(self, directory: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Save agent state.
 
         Args:
             directory: Directory to save to
+            data: Snapshot from snapshot_state() (default: take one now)
         """
-        self.context.save(f"{directory}/context.json")
-        self.goals.save(f"{directory}/goals.json")
+        if data is None:
+            data = self.snapshot_state(directory)
+        self.context.save(f"{directory}/context.json", data['context'])
+        self.goals.save(f"{directory}/goals.json", data['goals'])
         self.logger.info(f"Saved agent state to {directory}")
 
     def load_state(self, directory: str) -> None:
@@ -1,10 +1,74 @@
 """Pathfinder agent for complex navigation."""
 
-from typing import List, Tuple, Optional
-from anthropic import Anthropic
+from typing import List, Tuple, Optional, FrozenSet
+import asyncio
+import heapq
+import re
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from ..utils.anthropic_client import get_client
+from ..utils.async_runner import run_sync
+from ..utils.response_cache import ResponseCache
+
+# Limits concurrent API calls from this agent to respect rate limits
+_REQUEST_LIMIT = asyncio.Semaphore(4)
+
+# Moves accepted from AI responses
+_VALID_MOVES = frozenset({'up', 'down', 'left', 'right'})
+
+# Matches the "PATH:" line in AI responses
+_PATH_RE = re.compile(r'^[ \t]*PATH:[ \t]*(.*)$', re.MULTILINE)
+
+# Movement actions and their (dx, dy) deltas on the map grid
+_MOVES = (('up', 0, -1), ('down', 0, 1), ('left', -1, 0), ('right', 1, 0))
+_MOVE_BY_DELTA = {(dx, dy): name for name, dx, dy in _MOVES}
+
+
+def _astar(start_xy: Tuple[int, int], target_xy: Tuple[int, int],
+           walkable: FrozenSet[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+    """Find a shortest path on a 4-connected grid with unit step costs.
+
+    Args:
+        start_xy: Start (x, y)
+        target_xy: Target (x, y)
+        walkable: Tiles that may be stepped on
+
+    Returns:
+        List of (x, y) tiles from start to target inclusive, or None if unreachable
+    """
+    tx, ty = target_xy
+    open_heap = [(abs(start_xy[0] - tx) + abs(start_xy[1] - ty), 0, start_xy)]
+    came_from = {start_xy: None}
+    cost_so_far = {start_xy: 0}
+
+    while open_heap:
+        _, cost, node = heapq.heappop(open_heap)
+
+        if node == target_xy:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = came_from[node]
+            return path[::-1]
+
+        if cost > cost_so_far[node]:
+            continue  # Stale heap entry
+
+        x, y = node
+        for _, dx, dy in _MOVES:
+            neighbor = (x + dx, y + dy)
+            if neighbor not in walkable:
+                continue
+            new_cost = cost + 1
+            if new_cost < cost_so_far.get(neighbor, new_cost + 1):
+                cost_so_far[neighbor] = new_cost
+                came_from[neighbor] = node
+                # Manhattan distance is exact-or-under on this grid, so A* stays optimal
+                priority = new_cost + abs(neighbor[0] - tx) + abs(neighbor[1] - ty)
+                heapq.heappush(open_heap, (priority, new_cost, neighbor))
+
+    return None
 
 
 class PathfinderAgent:
@@ -34,23 +98,89 @@ PATH: <comma-separated list of moves, e.g., "up,up,right,right,up">
         self.logger = get_logger('Pathfinder')
         self.config = get_config()
 
-        # Initialize AI client with custom base_url if provided
-        import os
-        base_url = os.getenv('ANTHROPIC_BASE_URL')
-        if base_url:
-            self.client = Anthropic(base_url=base_url)
-        else:
-            self.client = Anthropic()
+        # All agents share one client and HTTP/2 keep-alive pool
+        self.client = get_client()
 
         self.model = self.config.get('ai.agents.pathfinder.model')
         self.temperature = self.config.get('ai.agents.pathfinder.temperature')
 
+        # Parsed paths from earlier queries, keyed on start/target/explored tiles
+        self._cache = ResponseCache(max_size=512)
+
         self.logger.info("Pathfinder agent initialized")
 
     def find_path(self, start: Tuple[int, int, int], target: Tuple[int, int, int],
                   explored_tiles: List[Tuple[int, int]]) -> Optional[List[str]]:
+        """Blocking counterpart of afind_path for synchronous callers.
+
+        Args:
+            start: (map_id, x, y)
+            target: (map_id, x, y)
+            explored_tiles: List of explored (x, y) positions on current map
+
+        Returns:
+            List of actions, or None if no path found
+        """
+        path = self._local_path(start, target, explored_tiles)
+        if path is not None:
+            return path
+        return run_sync(self._ai_find_path(start, target, explored_tiles))
+
+    async def afind_path(self, start: Tuple[int, int, int], target: Tuple[int, int, int],
+                         explored_tiles: List[Tuple[int, int]]) -> Optional[List[str]]:
         """Find path from start to target.
 
+        Same-map paths through explored tiles are solved locally with A*; the AI
+        is only asked for cross-map routes or when no local path exists.
+
+        Args:
+            start: (map_id, x, y)
+            target: (map_id, x, y)
+            explored_tiles: List of explored (x, y) positions on current map
+
+        Returns:
+            List of actions, or None if no path found
+        """
+        path = self._local_path(start, target, explored_tiles)
+        if path is not None:
+            return path
+        return await self._ai_find_path(start, target, explored_tiles)
+
+    def _local_path(self, start: Tuple[int, int, int], target: Tuple[int, int, int],
+                    explored_tiles: List[Tuple[int, int]]) -> Optional[List[str]]:
+        """Solve a same-map path over explored tiles without calling the AI.
+
+        Args:
+            start: (map_id, x, y)
+            target: (map_id, x, y)
+            explored_tiles: List of explored (x, y) positions on current map
+
+        Returns:
+            List of moves (empty if already at target), or None if not solvable locally
+        """
+        if start[0] != target[0]:
+            return None  # Cross-map routes need knowledge of exits
+
+        start_xy = (start[1], start[2])
+        target_xy = (target[1], target[2])
+
+        # The target itself may not have been stepped on yet
+        walkable = frozenset(explored_tiles) | {start_xy, target_xy}
+        tiles = _astar(start_xy, target_xy, walkable)
+        if tiles is None:
+            return None
+
+        moves = [
+            _MOVE_BY_DELTA[(b[0] - a[0], b[1] - a[1])]
+            for a, b in zip(tiles, tiles[1:])
+        ]
+        self.logger.info(f"Found local path with {len(moves)} moves")
+        return moves
+
+    async def _ai_find_path(self, start: Tuple[int, int, int], target: Tuple[int, int, int],
+                            explored_tiles: List[Tuple[int, int]]) -> Optional[List[str]]:
+        """Ask the AI for a path.
+
         Args:
             start: (map_id, x, y)
             target: (map_id, x, y)
@@ -59,6 +189,12 @@ PATH: <comma-separated list of moves, e.g., "up,up,right,right,up">
         Returns:
             List of actions, or None if no path found
         """
+        cache_key = (start, target, frozenset(explored_tiles))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Using cached path with {len(cached)} moves")
+            return list(cached)
+
         self.logger.info(f"Finding path from {start} to {target}")
 
         # Build prompt
@@ -72,13 +208,14 @@ Explored tiles on current map: {len(explored_tiles)} tiles
 Plan a path and provide the sequence of moves."""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=self.temperature,
-                system=self.SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            async with _REQUEST_LIMIT:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=2000,
+                    temperature=self.temperature,
+                    system=self.SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}]
+                )
 
             response_text = response.content[0].text
 
@@ -87,6 +224,7 @@ Plan a path and provide the sequence of moves."""
 
             if path:
                 self.logger.info(f"Found path with {len(path)} moves")
+                self._cache.put(cache_key, tuple(path))
             else:
                 self.logger.warning("No path found")
 
@@ -105,13 +243,10 @@ Plan a path and provide the sequence of moves."""
         Returns:
             List of moves
         """
-        for line in response.split('\n'):
-            if line.strip().startswith('PATH:'):
-                path_str = line.replace('PATH:', '').strip()
-                moves = [m.strip().lower() for m in path_str.split(',')]
-                # Validate moves
-                valid_moves = ['up', 'down', 'left', 'right']
-                moves = [m for m in moves if m in valid_moves]
-                return moves if moves else None
-
-        return None
+        match = _PATH_RE.search(response)
+        if not match:
+            return None
+
+        moves = [m.strip().lower() for m in match.group(1).split(',')]
+        moves = [m for m in moves if m in _VALID_MOVES]
+        return moves if moves else None
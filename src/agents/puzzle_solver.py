@@ -1,10 +1,27 @@
 """Puzzle solver agent for boulder puzzles and complex challenges."""
 
-from typing import Dict, Any, Optional, List
-from anthropic import Anthropic
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+import json
+import re
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from ..utils.anthropic_client import get_client
+from ..utils.async_runner import run_sync
+from ..utils.response_cache import ResponseCache
+
+# Limits concurrent API calls from this agent to respect rate limits
+_REQUEST_LIMIT = asyncio.Semaphore(4)
+
+# Moves accepted from AI responses
+_VALID_MOVES = frozenset({'up', 'down', 'left', 'right', 'a', 'b'})
+
+# Matches the "SOLUTION:" line in AI responses
+_SOLUTION_RE = re.compile(r'^[ \t]*SOLUTION:[ \t]*(.*)$', re.MULTILINE)
+
+# Matches "SOLUTION <n>:" markers in batched responses
+_NUMBERED_SOLUTION_RE = re.compile(r'^[ \t]*SOLUTION[ \t]+(\d+):[ \t]*(.*)$', re.MULTILINE)
 
 
 class PuzzleSolverAgent:
@@ -32,20 +49,30 @@ SOLUTION: <comma-separated sequence of moves>
         self.logger = get_logger('PuzzleSolver')
         self.config = get_config()
 
-        # Initialize AI client with custom base_url if provided
-        import os
-        base_url = os.getenv('ANTHROPIC_BASE_URL')
-        if base_url:
-            self.client = Anthropic(base_url=base_url)
-        else:
-            self.client = Anthropic()
+        # All agents share one client and HTTP/2 keep-alive pool
+        self.client = get_client()
 
         self.model = self.config.get('ai.agents.puzzle_solver.model')
         self.temperature = self.config.get('ai.agents.puzzle_solver.temperature')
 
+        # Parsed solutions from earlier queries, keyed on description and state
+        self._cache = ResponseCache(max_size=512)
+
         self.logger.info("Puzzle solver agent initialized")
 
     def solve_puzzle(self, puzzle_description: str, puzzle_state: Dict[str, Any]) -> Optional[List[str]]:
+        """Blocking wrapper around asolve_puzzle for synchronous callers.
+
+        Args:
+            puzzle_description: Description of the puzzle
+            puzzle_state: Current state of the puzzle
+
+        Returns:
+            List of moves to solve puzzle
+        """
+        return run_sync(self.asolve_puzzle(puzzle_description, puzzle_state))
+
+    async def asolve_puzzle(self, puzzle_description: str, puzzle_state: Dict[str, Any]) -> Optional[List[str]]:
         """Solve a puzzle.
 
         Args:
@@ -55,6 +82,12 @@ SOLUTION: <comma-separated sequence of moves>
         Returns:
             List of moves to solve puzzle
         """
+        cache_key = self._cache_key(puzzle_description, puzzle_state)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Using cached solution with {len(cached)} moves")
+            return list(cached)
+
         self.logger.info(f"Solving puzzle: {puzzle_description}")
 
         prompt = f"""Puzzle: {puzzle_description}
@@ -64,13 +97,14 @@ Current state: {puzzle_state}
 Provide a solution as a sequence of moves."""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                temperature=self.temperature,
-                system=self.SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            async with _REQUEST_LIMIT:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=3000,
+                    temperature=self.temperature,
+                    system=self.SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}]
+                )
 
             response_text = response.content[0].text
 
@@ -78,6 +112,7 @@ Provide a solution as a sequence of moves."""
 
             if solution:
                 self.logger.info(f"Found solution with {len(solution)} moves")
+                self._cache.put(cache_key, tuple(solution))
             else:
                 self.logger.warning("No solution found")
 
@@ -87,6 +122,121 @@ Provide a solution as a sequence of moves."""
             self.logger.error(f"Puzzle solving failed: {e}")
             return None
 
+    def solve_puzzles(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[List[str]]]:
+        """Blocking wrapper around asolve_puzzles for synchronous callers.
+
+        Args:
+            items: List of (puzzle_description, puzzle_state) pairs
+
+        Returns:
+            One solution (or None) per item, in order
+        """
+        return run_sync(self.asolve_puzzles(items))
+
+    async def asolve_puzzles(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[List[str]]]:
+        """Solve several puzzles with a single API call.
+
+        Args:
+            items: List of (puzzle_description, puzzle_state) pairs
+
+        Returns:
+            One solution (or None) per item, in order
+        """
+        keys = [self._cache_key(description, state) for description, state in items]
+        results: List[Optional[List[str]]] = []
+        for key in keys:
+            cached = self._cache.get(key)
+            results.append(list(cached) if cached is not None else None)
+
+        # Only puzzles without a cached solution go to the AI
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        if len(pending) == 1:
+            results[pending[0]] = await self.asolve_puzzle(*items[pending[0]])
+            return results
+
+        self.logger.info(f"Solving {len(pending)} puzzles in one batch")
+
+        blocks = [
+            f"PUZZLE {n}:\n{items[i][0]}\nCurrent state: {items[i][1]}"
+            for n, i in enumerate(pending, 1)
+        ]
+        prompt = "\n\n".join(blocks) + f"""
+
+Solve each puzzle independently. Answer with one line per puzzle, in order:
+SOLUTION 1: <comma-separated sequence of moves>
+...
+SOLUTION {len(pending)}: <comma-separated sequence of moves>"""
+
+        try:
+            async with _REQUEST_LIMIT:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=3000 * len(pending),
+                    temperature=self.temperature,
+                    system=self.SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+
+            solutions = self._parse_solutions(response.content[0].text, len(pending))
+
+            for i, solution in zip(pending, solutions):
+                results[i] = solution
+                if solution:
+                    self._cache.put(keys[i], tuple(solution))
+
+            solved = sum(1 for s in solutions if s)
+            self.logger.info(f"Batch solved {solved}/{len(pending)} puzzles")
+
+        except Exception as e:
+            self.logger.error(f"Batch puzzle solving failed: {e}")
+
+        return results
+
+    @staticmethod
+    def _cache_key(puzzle_description: str, puzzle_state: Dict[str, Any]) -> str:
+        """Build a canonical cache key for a puzzle query.
+
+        Args:
+            puzzle_description: Description of the puzzle
+            puzzle_state: Current state of the puzzle
+
+        Returns:
+            Key string
+        """
+        return f"{puzzle_description}|{json.dumps(puzzle_state, sort_keys=True, default=str)}"
+
+    def _parse_solutions(self, response: str, count: int) -> List[Optional[List[str]]]:
+        """Parse numbered solutions from a batched response.
+
+        Args:
+            response: AI response
+            count: Number of puzzles in the batch
+
+        Returns:
+            One list of moves (or None) per puzzle
+        """
+        solutions: List[Optional[List[str]]] = [None] * count
+        for match in _NUMBERED_SOLUTION_RE.finditer(response):
+            index = int(match.group(1)) - 1
+            if 0 <= index < count:
+                solutions[index] = self._parse_moves(match.group(2))
+        return solutions
+
+    def _parse_moves(self, solution_str: str) -> Optional[List[str]]:
+        """Parse a comma-separated move list.
+
+        Args:
+            solution_str: Text after a SOLUTION marker
+
+        Returns:
+            List of valid moves, or None if there are none
+        """
+        moves = [m.strip().lower() for m in solution_str.split(',')]
+        moves = [m for m in moves if m in _VALID_MOVES]
+        return moves if moves else None
+
     def _parse_solution(self, response: str) -> Optional[List[str]]:
         """Parse solution from response.
 
@@ -96,13 +246,8 @@ Provide a solution as a sequence of moves."""
         Returns:
             List of moves
         """
-        for line in response.split('\n'):
-            if line.strip().startswith('SOLUTION:'):
-                solution_str = line.replace('SOLUTION:', '').strip()
-                moves = [m.strip().lower() for m in solution_str.split(',')]
-                # Validate moves
-                valid_moves = ['up', 'down', 'left', 'right', 'a', 'b']
-                moves = [m for m in moves if m in valid_moves]
-                return moves if moves else None
-
-        return None
+        match = _SOLUTION_RE.search(response)
+        if not match:
+            return None
+
+        return self._parse_moves(match.group(1))
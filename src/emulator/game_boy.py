@@ -1,5 +1,6 @@
 """Game Boy emulator wrapper using PyBoy."""
 
+import io
 from typing import Optional, Tuple
 import numpy as np
 from PIL import Image
@@ -59,31 +60,33 @@ class GameBoyEmulator:
         self.speed = speed
         self.frame_count = 0
 
-        self.logger.info("Emulator initialized successfully")
+        # PyBoy's memory accessors, bound directly to save a Python frame per
+        # byte on hot read paths:
+        #   read_memory(address) -> int       Read a byte from memory
+        #   write_memory(address, value)      Write a byte to memory
+        self._memory = self.pyboy.memory
+        self.read_memory = self._memory.__getitem__
+        self.write_memory = self._memory.__setitem__
 
-    def tick(self, ticks: int = 1) -> None:
-        """Advance emulator by N ticks.
+        # Preallocated destination for stable screen copies
+        self._screen_cache = np.empty_like(self.pyboy.screen.ndarray)
 
-        Args:
-            ticks: Number of ticks to advance
-        """
-        for _ in range(ticks):
-            self.pyboy.tick()
-            self.frame_count += 1
+        self.logger.info("Emulator initialized successfully")
 
-    def tick_with_events(self, ticks: int = 1) -> None:
-        """Advance emulator by N ticks while processing window events.
+    def tick(self, ticks: int = 1, render: bool = True) -> None:
+        """Advance emulator by N ticks.
 
-        This prevents the window from becoming unresponsive.
+        The frames run inside PyBoy in one call; only the last one is rendered.
 
         Args:
             ticks: Number of ticks to advance
+            render: Whether to render the final frame
         """
-        for _ in range(ticks):
-            # PyBoy's tick() already handles events internally
-            # Just call tick() which processes both game logic and window events
-            self.pyboy.tick()
-            self.frame_count += 1
+        self.pyboy.tick(ticks, render)
+        self.frame_count += ticks
+
+    # PyBoy's tick() already processes window events, so this is the same as tick()
+    tick_with_events = tick
 
     def press_button(self, button: str, duration: int = 20) -> None:
         """Press a button for specified duration.
@@ -96,11 +99,11 @@ class GameBoyEmulator:
             self.logger.warning(f"Invalid button: {button}")
             return
 
-        self.logger.debug(f"Pressing button: {button} for {duration} frames")
+        self.logger.debug("Pressing button: %s for %s frames", button, duration)
 
         # Press
         self.pyboy.send_input(self.BUTTONS[button])
-        self.tick(duration)
+        self.tick(duration, render=False)
 
         # Release
         self.pyboy.send_input(self.RELEASE_BUTTONS[button])
@@ -109,35 +112,36 @@ class GameBoyEmulator:
     def get_screen_image(self) -> Image.Image:
         """Get current screen as PIL Image.
 
+        The image shares memory with PyBoy's screen buffer, so it is only valid
+        until the next tick; use get_screen_array(copy=True) to keep a frame.
+
         Returns:
             PIL Image of current screen
         """
-        # Get screen buffer from PyBoy
         screen_array = self.pyboy.screen.ndarray
+        height, width, channels = screen_array.shape
 
-        # Convert to PIL Image
-        image = Image.fromarray(screen_array)
+        if channels == 4:
+            # RGBA raw buffers are wrapped without copying
+            return Image.frombuffer('RGBA', (width, height), screen_array, 'raw', 'RGBA', 0, 1)
 
-        return image
+        return Image.fromarray(screen_array)
 
-    def get_screen_array(self) -> np.ndarray:
+    def get_screen_array(self, copy: bool = False) -> np.ndarray:
         """Get current screen as numpy array.
 
-        Returns:
-            Numpy array of screen (160x144x3)
-        """
-        return self.pyboy.screen.ndarray
-
-    def read_memory(self, address: int) -> int:
-        """Read a byte from memory.
-
         Args:
-            address: Memory address to read
+            copy: Copy into a reused buffer instead of returning PyBoy's live view
 
         Returns:
-            Byte value at address
+            Numpy array of screen (144x160xC)
         """
-        return self.pyboy.memory[address]
+        screen_array = self.pyboy.screen.ndarray
+        if not copy:
+            return screen_array
+
+        np.copyto(self._screen_cache, screen_array)
+        return self._screen_cache
 
     def read_memory_range(self, address: int, length: int) -> bytes:
         """Read multiple bytes from memory.
@@ -149,16 +153,7 @@ class GameBoyEmulator:
         Returns:
             Bytes from memory
         """
-        return bytes([self.pyboy.memory[address + i] for i in range(length)])
-
-    def write_memory(self, address: int, value: int) -> None:
-        """Write a byte to memory.
-
-        Args:
-            address: Memory address to write
-            value: Byte value to write
-        """
-        self.pyboy.memory[address] = value
+        return bytes(self._memory[address:address + length])
 
     def save_state(self, filename: str) -> None:
         """Save emulator state.
@@ -170,6 +165,19 @@ class GameBoyEmulator:
         with open(filename, "wb") as f:
             self.pyboy.save_state(f)
 
+    def get_state_bytes(self) -> bytes:
+        """Capture emulator state in memory.
+
+        Lets the state be written to disk from another thread, since PyBoy
+        itself must only be touched from the emulation thread.
+
+        Returns:
+            Serialized emulator state
+        """
+        buffer = io.BytesIO()
+        self.pyboy.save_state(buffer)
+        return buffer.getvalue()
+
     def load_state(self, filename: str) -> None:
         """Load emulator state.
 
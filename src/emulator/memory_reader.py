@@ -1,18 +1,23 @@
 """Memory reader for Pokemon Red game state."""
 
 import json
-from typing import Dict, List, Any, Optional
+import struct
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from .game_boy import GameBoyEmulator
 from ..utils.logger import get_logger
 
 
+# Decimal value of each packed-BCD byte (two digits per byte)
+_BCD_LUT = tuple(((b >> 4) & 0xF) * 10 + (b & 0xF) for b in range(256))
+
+
 class MemoryReader:
     """Reads and interprets Pokemon Red memory."""
 
-    # Pokemon species names (first 151)
-    POKEMON_NAMES = [
+    # Pokemon species names by internal index, padded so every byte value maps to a name
+    POKEMON_NAMES: Tuple[str, ...] = (
         "None", "Rhydon", "Kangaskhan", "Nidoran♂", "Clefairy", "Spearow",
         "Voltorb", "Nidoking", "Slowbro", "Ivysaur", "Exeggutor", "Lickitung",
         "Exeggcute", "Grimer", "Gengar", "Nidoran♀", "Nidoqueen", "Cubone",
@@ -45,7 +50,8 @@ class MemoryReader:
         "Missingno", "Missingno", "Charmander", "Squirtle", "Charmeleon", "Wartortle",
         "Charizard", "Missingno", "Missingno", "Missingno", "Missingno", "Oddish",
         "Gloom", "Vileplume", "Bellsprout", "Weepinbell", "Victreebel"
-    ]
+    )
+    POKEMON_NAMES += ("Unknown",) * (256 - len(POKEMON_NAMES))
 
     def __init__(self, emulator: GameBoyEmulator, memory_map_path: str = "data/memory_addresses.json"):
         """Initialize memory reader.
@@ -57,156 +63,252 @@ class MemoryReader:
         self.emulator = emulator
         self.logger = get_logger('MemoryReader')
 
+        # Bound byte reader, looked up once
+        self._read = emulator.read_memory
+
         # Load memory map
         with open(memory_map_path, 'r') as f:
             self.memory_map = json.load(f)
 
+        # Resolve addresses and offsets once instead of on every read
+        position = self.memory_map['player']['position']
+        self._addr_x = int(position['x']['address'], 16)
+        self._addr_y = int(position['y']['address'], 16)
+        self._addr_map = int(position['map_id']['address'], 16)
+        self._addr_money = int(self.memory_map['player']['money']['address'], 16)
+
+        badges = self.memory_map['badges']
+        self._addr_badges = int(badges['address'], 16)
+        self._badge_table = tuple((name, 1 << int(bit)) for bit, name in badges['bits'].items())
+        self._badge_mask = sum(mask for _, mask in self._badge_table)
+
+        party = self.memory_map['party']
+        self._party_count_addr = int(party['count']['address'], 16)
+        self._party_base = int(party['pokemon']['base_address'], 16)
+        self._party_size = party['pokemon']['size']
+        self._field_names, self._pokemon_struct = self._build_pokemon_struct(party['pokemon']['fields'])
+        self._move_fields = tuple((f'move{i}', f'move{i}_pp') for i in range(1, 5))
+
+        self._addr_battle = int(self.memory_map['battle']['in_battle']['address'], 16)
+
+        # Contiguous memory ranges read in bulk once per state summary
+        max_count = party['pokemon'].get('max_count', 6)
+        self._summary_ranges, self._range_lo = self._build_summary_ranges([
+            (self._addr_x, 1), (self._addr_y, 1), (self._addr_map, 1),
+            (self._addr_money, 3), (self._addr_badges, 1), (self._addr_battle, 1),
+            (self._party_count_addr, 1), (self._party_base, max_count * self._party_size),
+        ])
+
         self.logger.info("Memory reader initialized")
 
-    def read_player_position(self) -> Dict[str, int]:
+    @staticmethod
+    def _build_pokemon_struct(fields: Dict[str, Any]):
+        """Build a struct layout for the party Pokemon fields.
+
+        Multi-byte values are big-endian in Pokemon Red's memory.
+
+        Args:
+            fields: Field definitions from the memory map
+
+        Returns:
+            Tuple of (field names in layout order, struct.Struct)
+        """
+        codes = {'uint8': 'B', 'uint16': 'H'}
+        sizes = {'uint8': 1, 'uint16': 2}
+
+        fmt = '>'
+        names = []
+        position = 0
+        for name, field in sorted(fields.items(), key=lambda item: item[1]['offset']):
+            fmt += 'x' * (field['offset'] - position)
+            fmt += codes[field['type']]
+            names.append(name)
+            position = field['offset'] + sizes[field['type']]
+
+        return tuple(names), struct.Struct(fmt)
+
+    @staticmethod
+    def _build_summary_ranges(fields: List[Tuple[int, int]], max_gap: int = 64):
+        """Merge field addresses into a few contiguous read ranges.
+
+        Args:
+            fields: List of (address, length) pairs
+            max_gap: Merge fields separated by at most this many unused bytes
+
+        Returns:
+            Tuple of (list of (lo, length) ranges, dict of field address -> range lo)
+        """
+        ranges = []
+        for address, length in sorted(fields):
+            end = address + length
+            if ranges and address - ranges[-1][1] <= max_gap:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([address, end])
+
+        range_lo = {}
+        for address, _ in fields:
+            range_lo[address] = next(lo for lo, end in ranges if lo <= address < end)
+
+        return [(lo, end - lo) for lo, end in ranges], range_lo
+
+    def _snapshot(self) -> Dict[int, bytes]:
+        """Read every summary range in bulk.
+
+        Returns:
+            Dict mapping range start address to its bytes
+        """
+        read_range = self.emulator.read_memory_range
+        return {lo: read_range(lo, length) for lo, length in self._summary_ranges}
+
+    def _byte(self, address: int, snapshot: Optional[Dict[int, bytes]]) -> int:
+        """Read a byte from a snapshot, or from memory when there is none.
+
+        Args:
+            address: Memory address (must be a precomputed summary field)
+            snapshot: Result of _snapshot(), or None
+
+        Returns:
+            Byte value
+        """
+        if snapshot is None:
+            return self._read(address)
+        lo = self._range_lo[address]
+        return snapshot[lo][address - lo]
+
+    def _bytes(self, address: int, length: int, snapshot: Optional[Dict[int, bytes]]) -> bytes:
+        """Read bytes from a snapshot, or from memory when there is none.
+
+        Args:
+            address: Start address (must be a precomputed summary field)
+            length: Number of bytes
+            snapshot: Result of _snapshot(), or None
+
+        Returns:
+            Bytes at address
+        """
+        if snapshot is None:
+            return self.emulator.read_memory_range(address, length)
+        lo = self._range_lo[address]
+        return snapshot[lo][address - lo:address - lo + length]
+
+    def read_player_position(self, snapshot: Optional[Dict[int, bytes]] = None) -> Dict[str, int]:
         """Read player position.
 
+        Args:
+            snapshot: Optional bulk memory snapshot to decode from
+
         Returns:
             Dict with x, y, map_id
         """
-        x = self.emulator.read_memory(int(self.memory_map['player']['position']['x']['address'], 16))
-        y = self.emulator.read_memory(int(self.memory_map['player']['position']['y']['address'], 16))
-        map_id = self.emulator.read_memory(int(self.memory_map['player']['position']['map_id']['address'], 16))
+        x = self._byte(self._addr_x, snapshot)
+        y = self._byte(self._addr_y, snapshot)
+        map_id = self._byte(self._addr_map, snapshot)
 
         return {'x': x, 'y': y, 'map_id': map_id}
 
-    def read_badges(self) -> Dict[str, bool]:
+    def read_badges(self, snapshot: Optional[Dict[int, bytes]] = None) -> Dict[str, bool]:
         """Read badge status.
 
+        Args:
+            snapshot: Optional bulk memory snapshot to decode from
+
         Returns:
             Dict mapping badge names to obtained status
         """
-        badge_byte = self.emulator.read_memory(int(self.memory_map['badges']['address'], 16))
-        badges = {}
-
-        for bit, name in self.memory_map['badges']['bits'].items():
-            badges[name] = bool(badge_byte & (1 << int(bit)))
-
-        return badges
+        badge_byte = self._byte(self._addr_badges, snapshot)
+        return {name: bool(badge_byte & mask) for name, mask in self._badge_table}
 
-    def count_badges(self) -> int:
+    def count_badges(self, snapshot: Optional[Dict[int, bytes]] = None) -> int:
         """Count number of badges obtained.
 
+        Args:
+            snapshot: Optional bulk memory snapshot to decode from
+
         Returns:
             Number of badges
         """
-        return sum(self.read_badges().values())
+        # Popcount of the badge byte (int.bit_count needs Python 3.10)
+        return bin(self._byte(self._addr_badges, snapshot) & self._badge_mask).count('1')
 
-    def read_party(self) -> List[Dict[str, Any]]:
+    def read_party(self, snapshot: Optional[Dict[int, bytes]] = None) -> List[Dict[str, Any]]:
         """Read Pokemon party.
 
+        Args:
+            snapshot: Optional bulk memory snapshot to decode from
+
         Returns:
             List of Pokemon data
         """
-        party_count = self.emulator.read_memory(int(self.memory_map['party']['count']['address'], 16))
+        party_count = self._byte(self._party_count_addr, snapshot)
 
         if party_count == 0 or party_count > 6:
             return []
 
-        party = []
-        base_addr = int(self.memory_map['party']['pokemon']['base_address'], 16)
-        size = self.memory_map['party']['pokemon']['size']
+        # One bulk read for the whole party, decoded per Pokemon with struct
+        blob = self._bytes(self._party_base, party_count * self._party_size, snapshot)
 
-        for i in range(party_count):
-            pokemon_addr = base_addr + (i * size)
-            pokemon_data = self._read_pokemon(pokemon_addr)
-            party.append(pokemon_data)
+        return [self._read_pokemon(blob, i * self._party_size) for i in range(party_count)]
 
-        return party
-
-    def _read_pokemon(self, base_address: int) -> Dict[str, Any]:
-        """Read individual Pokemon data.
+    def _read_pokemon(self, blob: bytes, offset: int) -> Dict[str, Any]:
+        """Decode individual Pokemon data from a party memory block.
 
         Args:
-            base_address: Base address of Pokemon data
+            blob: Raw party memory
+            offset: Offset of this Pokemon within blob
 
         Returns:
             Pokemon data dict
         """
-        fields = self.memory_map['party']['pokemon']['fields']
-
-        species_id = self.emulator.read_memory(base_address + fields['species']['offset'])
-        species_name = self.POKEMON_NAMES[species_id] if species_id < len(self.POKEMON_NAMES) else "Unknown"
+        fields = dict(zip(self._field_names, self._pokemon_struct.unpack_from(blob, offset)))
 
-        # Read HP (16-bit)
-        current_hp = self._read_uint16(base_address + fields['current_hp']['offset'])
-        max_hp = self._read_uint16(base_address + fields['max_hp']['offset'])
-
-        # Read level
-        level = self.emulator.read_memory(base_address + fields['level']['offset'])
+        species_id = fields['species']
+        species_name = self.POKEMON_NAMES[species_id]
 
         # Read moves and PP
         moves = []
-        for i in range(1, 5):
-            move_id = self.emulator.read_memory(base_address + fields[f'move{i}']['offset'])
-            pp = self.emulator.read_memory(base_address + fields[f'move{i}_pp']['offset'])
+        for move_field, pp_field in self._move_fields:
+            move_id = fields[move_field]
             if move_id > 0:
-                moves.append({'move_id': move_id, 'pp': pp})
-
-        # Read stats
-        attack = self._read_uint16(base_address + fields['attack']['offset'])
-        defense = self._read_uint16(base_address + fields['defense']['offset'])
-        speed = self._read_uint16(base_address + fields['speed']['offset'])
-        special = self._read_uint16(base_address + fields['special']['offset'])
+                moves.append({'move_id': move_id, 'pp': fields[pp_field]})
 
         return {
             'species_id': species_id,
             'species': species_name,
-            'level': level,
-            'current_hp': current_hp,
-            'max_hp': max_hp,
+            'level': fields['level'],
+            'current_hp': fields['current_hp'],
+            'max_hp': fields['max_hp'],
             'moves': moves,
             'stats': {
-                'attack': attack,
-                'defense': defense,
-                'speed': speed,
-                'special': special
+                'attack': fields['attack'],
+                'defense': fields['defense'],
+                'speed': fields['speed'],
+                'special': fields['special']
             }
         }
 
-    def _read_uint16(self, address: int) -> int:
-        """Read 16-bit unsigned integer (little-endian).
+    def read_money(self, snapshot: Optional[Dict[int, bytes]] = None) -> int:
+        """Read player money (BCD encoded).
 
         Args:
-            address: Memory address
-
-        Returns:
-            16-bit value
-        """
-        low = self.emulator.read_memory(address)
-        high = self.emulator.read_memory(address + 1)
-        return (high << 8) | low
-
-    def read_money(self) -> int:
-        """Read player money (BCD encoded).
+            snapshot: Optional bulk memory snapshot to decode from
 
         Returns:
             Money amount
         """
-        address = int(self.memory_map['player']['money']['address'], 16)
-        bcd_bytes = self.emulator.read_memory_range(address, 3)
-
-        # Convert BCD to decimal
-        money = 0
-        for byte in bcd_bytes:
-            high = (byte >> 4) & 0xF
-            low = byte & 0xF
-            money = money * 100 + high * 10 + low
-
-        return money
+        bcd_bytes = self._bytes(self._addr_money, 3, snapshot)
+        return _BCD_LUT[bcd_bytes[0]] * 10000 + _BCD_LUT[bcd_bytes[1]] * 100 + _BCD_LUT[bcd_bytes[2]]
 
-    def is_in_battle(self) -> bool:
+    def is_in_battle(self, snapshot: Optional[Dict[int, bytes]] = None) -> bool:
         """Check if currently in battle.
 
+        Args:
+            snapshot: Optional bulk memory snapshot to decode from
+
         Returns:
             True if in battle
         """
-        battle_type = self.emulator.read_memory(int(self.memory_map['battle']['in_battle']['address'], 16))
+        battle_type = self._byte(self._addr_battle, snapshot)
         return battle_type != 0
 
     def get_game_state_summary(self) -> Dict[str, Any]:
@@ -215,11 +317,14 @@ class MemoryReader:
         Returns:
             Dict with all relevant game state
         """
+        # One bulk read per memory range, then decode everything locally
+        snapshot = self._snapshot()
+
         return {
-            'position': self.read_player_position(),
-            'badges': self.read_badges(),
-            'badge_count': self.count_badges(),
-            'party': self.read_party(),
-            'money': self.read_money(),
-            'in_battle': self.is_in_battle(),
+            'position': self.read_player_position(snapshot),
+            'badges': self.read_badges(snapshot),
+            'badge_count': self.count_badges(snapshot),
+            'party': self.read_party(snapshot),
+            'money': self.read_money(snapshot),
+            'in_battle': self.is_in_battle(snapshot),
         }
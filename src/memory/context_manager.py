@@ -1,48 +1,87 @@
 """Context manager for long-term memory management."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from datetime import datetime
 import json
+import time
 from pathlib import Path
 
 from ..utils.logger import get_logger
 
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; turn logs then use JSON lines
+    msgpack = None
+
 
 @dataclass
 class Turn:
     """Represents a single turn in the game."""
     turn_number: int
-    timestamp: str
+    timestamp_ns: int
     state: Dict[str, Any]
     action: Optional[str]
     reasoning: Optional[str]
     result: Optional[str]
 
+    @property
+    def timestamp(self) -> str:
+        """ISO-formatted local time of the turn, built only when read."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+
 
 class ContextManager:
     """Manages AI context with periodic summarization."""
 
-    def __init__(self, max_turns: int = 100, keep_recent: int = 20):
+    # Rough characters-per-token ratio used for prompt budgeting
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, max_turns: int = 100, keep_recent: int = 20, serializer: str = 'json',
+                 max_summaries: int = 50, turn_log: Optional[str] = None):
         """Initialize context manager.
 
         Args:
             max_turns: Summarize context after this many turns
             keep_recent: Keep this many recent turns in full detail
+            serializer: Format for the saved turn log ('json' or 'msgpack')
+            max_summaries: Keep at most this many period summaries
+            turn_log: Base path of one turn log shared by every save
+                (None = a log next to each saved context file)
         """
         self.logger = get_logger('ContextManager')
         self.max_turns = max_turns
         self.keep_recent = keep_recent
+        self.max_summaries = max_summaries
+
+        if serializer == 'msgpack' and msgpack is None:
+            self.logger.warning("msgpack not installed, saving turns as JSON lines")
+            serializer = 'json'
+        self.serializer = serializer
 
         # Full turn history (recent only)
-        self.recent_turns: List[Turn] = []
+        self.recent_turns: Deque[Turn] = deque(maxlen=max_turns)
 
         # Summarized history
-        self.summaries: List[str] = []
+        self.summaries: Deque[str] = deque(maxlen=max_summaries)
 
         # Current summary period
         self.current_period_start = 0
 
+        # Rendered AI context, reused until turns or summaries change
+        self._version = 0
+        self._cache_v = -1
+        self._cache_s = ""
+
+        # Append-only persistence: turns ever added vs. turns already written,
+        # and the log whose tail currently matches recent_turns
+        self.turn_log = turn_log
+        self._turns_added = 0
+        self._last_saved_idx = 0
+        self._saved_log: Optional[Path] = None
+
         self.logger.info(f"Context manager initialized (max_turns={max_turns}, keep_recent={keep_recent})")
 
     def add_turn(self, turn_number: int, state: Dict[str, Any],
@@ -59,7 +98,7 @@ class ContextManager:
         """
         turn = Turn(
             turn_number=turn_number,
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             state=state,
             action=action,
             reasoning=reasoning,
@@ -67,6 +106,8 @@ class ContextManager:
         )
 
         self.recent_turns.append(turn)
+        self._turns_added += 1
+        self._version += 1
 
         # Check if we need to summarize
         if len(self.recent_turns) >= self.max_turns:
@@ -77,10 +118,12 @@ class ContextManager:
 
     def _trim_to_recent(self) -> None:
         """Keep only recent turns, discarding old ones."""
-        if len(self.recent_turns) > self.keep_recent:
-            old_turns = self.recent_turns[:-self.keep_recent]
-            self.recent_turns = self.recent_turns[-self.keep_recent:]
-            self.logger.debug(f"Trimmed to {len(self.recent_turns)} recent turns, discarded {len(old_turns)}")
+        discarded = len(self.recent_turns) - self.keep_recent
+        if discarded > 0:
+            for _ in range(discarded):
+                self.recent_turns.popleft()
+            self._version += 1
+            self.logger.debug("Trimmed to %d recent turns, discarded %d", len(self.recent_turns), discarded)
 
     def add_summary(self, summary: str, period_start: int, period_end: int) -> None:
         """Add a summary of a period.
@@ -92,38 +135,71 @@ class ContextManager:
         """
         summary_entry = f"[Turns {period_start}-{period_end}]: {summary}"
         self.summaries.append(summary_entry)
+        self._version += 1
         self.current_period_start = period_end + 1
         self.logger.info(f"Added summary for turns {period_start}-{period_end}")
 
-    def get_context_for_ai(self) -> str:
+    def get_context_for_ai(self, max_tokens: Optional[int] = None) -> str:
         """Get formatted context for AI consumption.
 
+        Args:
+            max_tokens: Approximate token budget; oldest summaries are dropped
+                first, then oldest turns (None = no limit)
+
         Returns:
             Formatted context string
         """
+        cache_key = (self._version, max_tokens)
+        if self._cache_v == cache_key:
+            return self._cache_s
+
+        summaries = [summary + "\n" for summary in self.summaries]
+
+        # Fragments per turn, joined once at the end
+        turn_parts = []
+        for turn in self.recent_turns:
+            parts = [f"\n--- Turn {turn.turn_number} ---\n"]
+            if turn.action:
+                parts.append(f"Action: {turn.action}\n")
+            if turn.reasoning:
+                parts.append(f"Reasoning: {turn.reasoning}\n")
+            if turn.result:
+                parts.append(f"Result: {turn.result}\n")
+            turn_parts.append(parts)
+
+        # Trim to budget, estimating tokens from character count
+        if max_tokens is not None:
+            turn_lens = [sum(map(len, parts)) for parts in turn_parts]
+            excess = sum(map(len, summaries)) + sum(turn_lens) \
+                - max_tokens * self.CHARS_PER_TOKEN
+            drop = 0
+            while excess > 0 and drop < len(summaries):
+                excess -= len(summaries[drop])
+                drop += 1
+            summaries = summaries[drop:]
+            drop = 0
+            while excess > 0 and drop < len(turn_parts):
+                excess -= turn_lens[drop]
+                drop += 1
+            turn_parts = turn_parts[drop:]
+
         context_parts = []
 
         # Add summaries
-        if self.summaries:
+        if summaries:
             context_parts.append("=== PREVIOUS ACTIVITY SUMMARY ===\n")
-            for summary in self.summaries:
-                context_parts.append(summary + "\n")
+            context_parts.extend(summaries)
             context_parts.append("\n")
 
         # Add recent turns
-        if self.recent_turns:
+        if turn_parts:
             context_parts.append("=== RECENT TURNS (Detailed) ===\n")
-            for turn in self.recent_turns:
-                turn_text = f"\n--- Turn {turn.turn_number} ---\n"
-                if turn.action:
-                    turn_text += f"Action: {turn.action}\n"
-                if turn.reasoning:
-                    turn_text += f"Reasoning: {turn.reasoning}\n"
-                if turn.result:
-                    turn_text += f"Result: {turn.result}\n"
-                context_parts.append(turn_text)
-
-        return "".join(context_parts)
+            for parts in turn_parts:
+                context_parts.extend(parts)
+
+        self._cache_v = cache_key
+        self._cache_s = "".join(context_parts)
+        return self._cache_s
 
     def needs_summarization(self) -> bool:
         """Check if context needs summarization.
@@ -141,35 +217,109 @@ class ContextManager:
         """
         # Return all but the most recent turns
         if len(self.recent_turns) > self.keep_recent:
-            return self.recent_turns[:-self.keep_recent]
+            return list(islice(self.recent_turns, len(self.recent_turns) - self.keep_recent))
         return []
 
-    def save(self, filepath: str) -> None:
-        """Save context to file.
+    @staticmethod
+    def _turns_path(filepath: str, serializer: str) -> Path:
+        """Get the turn log path for a base path.
 
         Args:
-            filepath: Path to save file
+            filepath: Context header file path or turn log base path
+            serializer: Format of the log
+
+        Returns:
+            Path of the turn log
         """
-        data = {
-            'summaries': self.summaries,
-            'recent_turns': [
-                {
-                    'turn_number': t.turn_number,
-                    'timestamp': t.timestamp,
-                    'action': t.action,
-                    'reasoning': t.reasoning,
-                    'result': t.result,
-                }
-                for t in self.recent_turns
-            ],
-            'current_period_start': self.current_period_start,
+        suffix = '.turns.msgpack' if serializer == 'msgpack' else '.turns.jsonl'
+        return Path(filepath + suffix)
+
+    def snapshot(self, filepath: str) -> Dict[str, Any]:
+        """Copy the unsaved turns and the summaries into plain data for save().
+
+        The snapshot counts as saved: the next one only holds turns added
+        after it.
+
+        Args:
+            filepath: Path the snapshot will be saved to
+
+        Returns:
+            Serializable context data
+        """
+        turns_path = self._turns_path(self.turn_log or filepath, self.serializer)
+
+        # Until this log's tail is known to match recent_turns, append every turn still held
+        if turns_path != self._saved_log:
+            new_count = len(self.recent_turns)
+        else:
+            new_count = min(self._turns_added - self._last_saved_idx, len(self.recent_turns))
+
+        new_turns = islice(self.recent_turns, len(self.recent_turns) - new_count, None)
+        records = [
+            {
+                'turn_number': t.turn_number,
+                'timestamp': t.timestamp,
+                'action': t.action,
+                'reasoning': t.reasoning,
+                'result': t.result,
+            }
+            for t in new_turns
+        ]
+
+        self._saved_log = turns_path
+        self._last_saved_idx = self._turns_added
+
+        return {
+            'turns_path': str(turns_path),
+            'records': records,
+            'header': {
+                'summaries': list(self.summaries),
+                'recent_count': len(self.recent_turns),
+                'current_period_start': self.current_period_start,
+                'serializer': self.serializer,
+            },
         }
 
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+    def save(self, filepath: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Save context to file.
 
-        self.logger.info(f"Saved context to {filepath}")
+        Summaries go to a small header file; turns are appended to a separate
+        log, so each save only writes the turns added since the last one.
+        The header records the log's length at this save, so checkpoints
+        can share one log. Only touches the snapshot, so it can run off the
+        game loop.
+
+        Args:
+            filepath: Path to save file
+            data: Snapshot from snapshot() (default: take one now)
+        """
+        if data is None:
+            data = self.snapshot(filepath)
+
+        turns_path = Path(data['turns_path'])
+        records = data['records']
+
+        try:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            turns_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if data['header']['serializer'] == 'msgpack':
+                payload = b''.join(msgpack.packb(r, use_bin_type=True) for r in records)
+            else:
+                payload = ''.join(json.dumps(r) + '\n' for r in records).encode('utf-8')
+            with open(turns_path, 'ab') as f:
+                f.write(payload)
+                offset = f.tell()
+
+            header = dict(data['header'], turn_log=str(turns_path), turn_log_offset=offset)
+            with open(filepath, 'w') as f:
+                json.dump(header, f, indent=2)
+        except Exception:
+            # The log may now be missing turns; the next save rewrites them all
+            self._saved_log = None
+            raise
+
+        self.logger.info(f"Saved context to {filepath} ({len(records)} new turns)")
 
     def load(self, filepath: str) -> None:
         """Load context from file.
@@ -184,26 +334,77 @@ class ContextManager:
         with open(filepath, 'r') as f:
             data = json.load(f)
 
-        self.summaries = data.get('summaries', [])
+        self.summaries = deque(data.get('summaries', []), maxlen=self.max_summaries)
         self.current_period_start = data.get('current_period_start', 0)
 
+        turns_path = None
+        if 'recent_turns' in data:
+            # Single-file format written before turns moved to a log
+            records = data['recent_turns']
+        else:
+            serializer = data.get('serializer', 'json')
+            turns_path = Path(data.get('turn_log') or self._turns_path(filepath, serializer))
+            offset = data.get('turn_log_offset')
+            records = self._read_turn_log(turns_path, serializer, offset)
+            records = records[len(records) - data.get('recent_count', len(records)):]
+
         # Reconstruct recent turns (without full state data)
-        for turn_data in data.get('recent_turns', []):
+        for turn_data in records:
             turn = Turn(
                 turn_number=turn_data['turn_number'],
-                timestamp=turn_data['timestamp'],
+                timestamp_ns=int(datetime.fromisoformat(turn_data['timestamp']).timestamp() * 1e9),
                 state={},  # State not saved to reduce size
                 action=turn_data.get('action'),
                 reasoning=turn_data.get('reasoning'),
                 result=turn_data.get('result'),
             )
             self.recent_turns.append(turn)
+        self._turns_added += len(records)
+        self._version += 1
+
+        # Later saves can append to the log directly only if this was its
+        # latest save; otherwise they first append every turn now held
+        self._saved_log = None
+        if (turns_path is not None and offset is not None and serializer == self.serializer
+                and turns_path.exists() and turns_path.stat().st_size == offset):
+            self._saved_log = turns_path
+            self._last_saved_idx = self._turns_added
 
         self.logger.info(f"Loaded context from {filepath} ({len(self.summaries)} summaries, {len(self.recent_turns)} recent turns)")
 
+    def _read_turn_log(self, turns_path: Path, serializer: str,
+                       offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the records of a turn log.
+
+        Args:
+            turns_path: Turn log path
+            serializer: Format the log was written in
+            offset: Only read the log up to this byte offset (None = whole log)
+
+        Returns:
+            List of turn records, oldest first
+        """
+        if not turns_path.exists():
+            return []
+
+        if serializer == 'msgpack' and msgpack is None:
+            self.logger.warning(f"msgpack not installed, cannot read {turns_path}")
+            return []
+
+        with open(turns_path, 'rb') as f:
+            data = f.read() if offset is None else f.read(offset)
+
+        if serializer == 'msgpack':
+            unpacker = msgpack.Unpacker(raw=False)
+            unpacker.feed(data)
+            return list(unpacker)
+
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+
     def clear(self) -> None:
         """Clear all context."""
         self.recent_turns.clear()
         self.summaries.clear()
         self.current_period_start = 0
+        self._version += 1
         self.logger.info("Cleared all context")
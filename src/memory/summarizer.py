@@ -1,32 +1,85 @@
 """Summarizer for compressing game history."""
 
-from typing import List
-from anthropic import Anthropic
+import asyncio
+import hashlib
+import json
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from ..utils.anthropic_client import get_client
+from ..utils.async_runner import run_sync
+from ..utils.response_cache import ResponseCache
 from .context_manager import Turn
 
 
+# Fixed instructions for asummarize_turns, sent as a cacheable prefix block
+_TURN_SUMMARY_INSTRUCTIONS = """You are summarizing a sequence of gameplay actions from Pokemon Red.
+
+Please create a concise summary (2-3 sentences) of the turns that follow, focusing on:
+- Major progress made (badges earned, Pokemon caught, significant locations reached)
+- Current objectives being pursued
+- Any challenges or obstacles encountered
+
+Provide ONLY the summary, no additional commentary."""
+
+# Per-call turn list that follows the instructions
+_TURN_LIST_TMPL = "Turns to summarize ({count}):\n{turns}"
+
+_TEXT_SUMMARY_TMPL = """Summarize the following text concisely:
+
+{text}
+
+Provide only the summary."""
+
+_BATCH_SUMMARY_TMPL = """Summarize each of these {count} texts concisely.
+
+Texts (JSON list):
+{texts}
+
+Return ONLY a JSON list of {count} summary strings, in the same order."""
+
+
 class Summarizer:
     """Creates summaries of game history using AI."""
 
-    def __init__(self):
-        """Initialize summarizer."""
+    def __init__(self, max_batch: int = 16, max_wait_ms: float = 10.0):
+        """Initialize summarizer.
+
+        Args:
+            max_batch: Most asummarize_text calls combined into one request
+            max_wait_ms: How long to wait for more calls before sending a batch
+        """
         self.logger = get_logger('Summarizer')
         self.config = get_config()
 
-        # Initialize AI client with custom base_url if provided
-        import os
-        base_url = os.getenv('ANTHROPIC_BASE_URL')
-        if base_url:
-            self.client = Anthropic(base_url=base_url)
-        else:
-            self.client = Anthropic()
+        # All agents share one client and HTTP/2 keep-alive pool
+        self.client = get_client()
+
+        # asummarize_text micro-batching; created on the event loop at first use
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._text_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+        # Summaries of earlier turn sequences, keyed on a digest of their descriptions
+        self._turn_cache = ResponseCache(max_size=512)
 
         self.logger.info("Summarizer initialized")
 
     def summarize_turns(self, turns: List[Turn]) -> str:
+        """Blocking counterpart of asummarize_turns for synchronous callers.
+
+        Args:
+            turns: List of turns to summarize
+
+        Returns:
+            Summary text
+        """
+        return run_sync(self.asummarize_turns(turns))
+
+    async def asummarize_turns(self, turns: List[Turn]) -> str:
         """Summarize a list of turns.
 
         Args:
@@ -50,38 +103,97 @@ class Summarizer:
                 desc += f", Result={turn.result}"
             turn_descriptions.append(desc)
 
-        prompt = f"""You are summarizing a sequence of gameplay actions from Pokemon Red.
-
-Please create a concise summary (2-3 sentences) of the following {len(turns)} turns, focusing on:
-- Major progress made (badges earned, Pokemon caught, significant locations reached)
-- Current objectives being pursued
-- Any challenges or obstacles encountered
+        # Repeated sequences (e.g. while stuck) reuse the earlier summary. Turn
+        # numbers are left out of the key so the same activity later still matches.
+        normalized = "\n".join(f"{turn.action}|{turn.result}" for turn in turns)
+        cache_key = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+        cached = self._turn_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Using cached summary")
+            return cached
 
-Turns to summarize:
-{chr(10).join(turn_descriptions)}
-
-Provide ONLY the summary, no additional commentary."""
+        # The instructions never change, so the server can reuse their cached prefix
+        content = [
+            {
+                "type": "text",
+                "text": _TURN_SUMMARY_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": _TURN_LIST_TMPL.format(count=len(turns), turns="\n".join(turn_descriptions))
+            },
+        ]
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.config.get('ai.model'),
                 max_tokens=300,
                 temperature=0.3,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": content}]
             )
 
             summary = response.content[0].text.strip()
             self.logger.info(f"Generated summary: {summary[:100]}...")
+            self._turn_cache.put(cache_key, summary)
 
             return summary
 
         except Exception as e:
             self.logger.error(f"Failed to generate summary: {e}")
-            return f"Summary generation failed. {len(turns)} turns of activity occurred."
+            return self._local_summary(turns)
+
+    @staticmethod
+    def _local_summary(turns: List[Turn]) -> str:
+        """Build a summary from the turn data alone, for when the API fails.
+
+        Args:
+            turns: List of turns to summarize
+
+        Returns:
+            Summary text
+        """
+        parts = [f"Turns {turns[0].turn_number}-{turns[-1].turn_number}:"]
+
+        actions = Counter(turn.action for turn in turns if turn.action)
+        if actions:
+            common = ", ".join(f"{action} x{count}" for action, count in actions.most_common(3))
+            parts.append(f"mostly {common}.")
+
+        memories = [turn.state.get('memory', {}) for turn in turns if turn.state]
+        badge_counts = [memory['badge_count'] for memory in memories if 'badge_count' in memory]
+        if badge_counts and badge_counts[-1] != badge_counts[0]:
+            parts.append(f"Badges went from {badge_counts[0]} to {badge_counts[-1]}.")
+
+        map_ids = [memory['position']['map_id'] for memory in memories if 'position' in memory]
+        if map_ids:
+            parts.append(f"Visited {len(set(map_ids))} map(s), ending on map {map_ids[-1]}.")
+
+        notable = [turn.result for turn in turns
+                   if turn.result and any(word in turn.result.lower() for word in ('badge', 'caught'))]
+        if notable:
+            parts.append("Notable: " + "; ".join(notable[-3:]) + ".")
+
+        return " ".join(parts)
 
     def summarize_text(self, text: str, max_length: int = 200) -> str:
+        """Blocking counterpart of asummarize_text for synchronous callers.
+
+        Args:
+            text: Text to summarize
+            max_length: Maximum tokens for summary
+
+        Returns:
+            Summary
+        """
+        return run_sync(self.asummarize_text(text, max_length))
+
+    async def asummarize_text(self, text: str, max_length: int = 200) -> str:
         """Summarize arbitrary text.
 
+        Concurrent calls arriving within a short window are coalesced into a
+        single API request.
+
         Args:
             text: Text to summarize
             max_length: Maximum tokens for summary
@@ -89,14 +201,57 @@ Provide ONLY the summary, no additional commentary."""
         Returns:
             Summary
         """
-        prompt = f"""Summarize the following text concisely:
+        if self._text_queue is None:
+            self._text_queue = asyncio.Queue(maxsize=self.max_batch * 4)
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.ensure_future(self._batch_loop())
 
-{text}
+        future = asyncio.get_running_loop().create_future()
+        # Blocks when the queue is full, applying backpressure to callers
+        await self._text_queue.put((text, max_length, future))
+        return await future
 
-Provide only the summary."""
+    async def _batch_loop(self) -> None:
+        """Drain queued asummarize_text calls into batched requests."""
+        queue = self._text_queue
+        while True:
+            batch = [await queue.get()]
+
+            # Collect more requests until the batch is full or the window closes
+            deadline = asyncio.get_running_loop().time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) == 1:
+                text, max_length, future = batch[0]
+                results = [await self._summarize_one(text, max_length)]
+            else:
+                results = await self._summarize_batch(batch)
+
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _summarize_one(self, text: str, max_length: int) -> str:
+        """Summarize a single text with its own request.
+
+        Args:
+            text: Text to summarize
+            max_length: Maximum tokens for summary
+
+        Returns:
+            Summary
+        """
+        prompt = _TEXT_SUMMARY_TMPL.format(text=text)
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.config.get('ai.model'),
                 max_tokens=max_length,
                 temperature=0.3,
@@ -108,3 +263,36 @@ Provide only the summary."""
         except Exception as e:
             self.logger.error(f"Failed to summarize text: {e}")
             return text[:max_length] + "..."
+
+    async def _summarize_batch(self, batch: List[Tuple[str, int, asyncio.Future]]) -> List[str]:
+        """Summarize several texts with one request returning a JSON list.
+
+        Args:
+            batch: List of (text, max_length, future) entries
+
+        Returns:
+            One summary per entry, in order
+        """
+        self.logger.info(f"Summarizing {len(batch)} texts in one request")
+
+        texts = [text for text, _, _ in batch]
+        prompt = _BATCH_SUMMARY_TMPL.format(count=len(texts), texts=json.dumps(texts))
+
+        try:
+            response = await self.client.messages.create(
+                model=self.config.get('ai.model'),
+                max_tokens=sum(max_length for _, max_length, _ in batch),
+                temperature=0.3,
+                messages=[{"role": "user", "content": prompt}]
+            )
+
+            response_text = response.content[0].text
+            summaries = json.loads(response_text[response_text.index('['):response_text.rindex(']') + 1])
+            if len(summaries) != len(batch):
+                raise ValueError(f"expected {len(batch)} summaries, got {len(summaries)}")
+
+            return [str(summary).strip() for summary in summaries]
+
+        except Exception as e:
+            self.logger.error(f"Failed to summarize batch: {e}")
+            return [text[:max_length] + "..." for text, max_length, _ in batch]
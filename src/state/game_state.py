@@ -32,6 +32,9 @@ class GameState:
         self.turn_count = 0
         self.last_update = None
 
+        # (turn, text) of the last text representation built
+        self._text_cache = (None, None)
+
     def update(self) -> Dict[str, Any]:
         """Update and return current game state.
 
@@ -77,6 +80,8 @@ class GameState:
     def get_text_representation(self, state: Optional[Dict[str, Any]] = None) -> str:
         """Convert game state to text representation for AI.
 
+        Each turn's text is built once; later calls for the same turn reuse it.
+
         Args:
             state: Game state dict (uses last state if None)
 
@@ -84,7 +89,11 @@ class GameState:
             Text representation of game state
         """
         if state is None:
+            if self._text_cache[0] is not None and self._text_cache[0] == self.turn_count:
+                return self._text_cache[1]
             state = self.update()
+        elif self._text_cache[0] == state['turn']:
+            return self._text_cache[1]
 
         memory = state['memory']
         position = memory['position']
@@ -92,49 +101,56 @@ class GameState:
         party = memory['party']
         visual = state['visual']
 
-        text = f"""=== GAME STATE (Turn {state['turn']}) ===
-
-POSITION:
-- Map ID: {position['map_id']}
-- Coordinates: ({position['x']}, {position['y']})
-- Grid Position: {visual.get('grid_position', 'N/A')}
-
-BADGES: {memory['badge_count']}/8
-"""
-        for badge_name, obtained in badges.items():
-            status = "[X]" if obtained else "[ ]"
-            text += f"  {status} {badge_name}\n"
-
-        text += f"\nMONEY: ${memory['money']}\n"
-
-        text += f"\nPARTY: {len(party)} Pokemon\n"
+        parts = [
+            f"=== GAME STATE (Turn {state['turn']}) ===",
+            "",
+            "POSITION:",
+            f"- Map ID: {position['map_id']}",
+            f"- Coordinates: ({position['x']}, {position['y']})",
+            f"- Grid Position: {visual.get('grid_position', 'N/A')}",
+            "",
+        ]
+
+        # Only obtained badges are listed; the rest are implied by the count
+        obtained_badges = [name for name, obtained in badges.items() if obtained]
+        parts.append(f"BADGES: {memory['badge_count']}/8 - {', '.join(obtained_badges) or 'None'}")
+
+        parts.append("")
+        parts.append(f"MONEY: ${memory['money']}")
+
+        parts.append("")
+        parts.append(f"PARTY: {len(party)} Pokemon")
         for i, pokemon in enumerate(party, 1):
             hp_percent = (pokemon['current_hp'] / pokemon['max_hp'] * 100) if pokemon['max_hp'] > 0 else 0
-            text += f"  {i}. {pokemon['species']} Lv.{pokemon['level']} - HP: {pokemon['current_hp']}/{pokemon['max_hp']} ({hp_percent:.0f}%)\n"
-            text += f"     Moves: {len(pokemon['moves'])} | "
-            for move in pokemon['moves']:
-                text += f"[PP:{move['pp']}] "
-            text += "\n"
+            parts.append(f"  {i}. {pokemon['species']} Lv.{pokemon['level']} - HP: {pokemon['current_hp']}/{pokemon['max_hp']} ({hp_percent:.0f}%)")
+            pp_list = "".join([f"[PP:{move['pp']}] " for move in pokemon['moves']])
+            parts.append(f"     Moves: {len(pokemon['moves'])} | {pp_list}")
 
         if memory['in_battle']:
-            text += "\n⚔️  CURRENTLY IN BATTLE\n"
+            parts.append("")
+            parts.append("⚔️  CURRENTLY IN BATTLE")
 
-        text += f"\nVISUAL ANALYSIS:\n"
-        text += f"  Screen Description: {visual.get('description', 'No description')}\n"
-        text += f"  Detected Elements: {', '.join(visual.get('elements', []))}\n"
+        parts.append("")
+        parts.append("VISUAL ANALYSIS:")
+        parts.append(f"  Screen Description: {visual.get('description', 'No description')}")
+        parts.append(f"  Detected Elements: {', '.join(visual.get('elements', []))}")
 
-        text += f"\nEXPLORATION:\n"
-        text += f"  Current Map Explored: {state['map_memory']['exploration_percent']:.1f}%\n"
-        text += f"  Tiles Explored: {state['map_memory']['explored_tiles']}/{state['map_memory']['total_tiles']}\n"
+        parts.append("")
+        parts.append("EXPLORATION:")
+        parts.append(f"  Current Map Explored: {state['map_memory']['exploration_percent']:.1f}%")
+        parts.append(f"  Tiles Explored: {state['map_memory']['explored_tiles']}/{state['map_memory']['total_tiles']}")
 
         unexplored = state['exploration'].get('nearby_unexplored', [])
         if unexplored:
-            text += f"  Nearby Unexplored Tiles: {len(unexplored)}\n"
-            for tile in unexplored[:5]:  # Show first 5
-                text += f"    - ({tile[0]}, {tile[1]})\n"
+            nearest = ' '.join(f"({tile[0]}, {tile[1]})" for tile in unexplored[:5])  # Show first 5
+            parts.append(f"  Nearby Unexplored Tiles: {len(unexplored)} - {nearest}")
 
-        text += "\n" + "="*50 + "\n"
+        parts.append("")
+        parts.append("=" * 50)
+        parts.append("")
 
+        text = "\n".join(parts)
+        self._text_cache = (state['turn'], text)
         return text
 
     def get_simple_state(self) -> Dict[str, Any]:
@@ -1,11 +1,102 @@
 """Map memory system with fog-of-war tracking."""
 
-import json
-from typing import Dict, List, Tuple, Set, Any
+import mmap
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple, Any, Optional
 from pathlib import Path
-from collections import defaultdict
+import numpy as np
 
 from ..utils.logger import get_logger
+from ..utils import json_io
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels then run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Map coordinates are single bytes
+MAP_SIZE = 256
+
+# One byte per tile in each map_<id>.bin grid file
+_GRID_BYTES = MAP_SIZE * MAP_SIZE
+
+
+@njit(cache=True)
+def _scan_unexplored(grid: np.ndarray, x: int, y: int, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Find unexplored tiles in a square window, in scan order.
+
+    Args:
+        grid: MAP_SIZE x MAP_SIZE bool array of explored tiles, indexed [x, y]
+        x: Center X coordinate
+        y: Center Y coordinate
+        radius: Search radius
+
+    Returns:
+        (N, 2) array of (x, y) positions and their Manhattan distances
+    """
+    x0 = max(x - radius, 0)
+    y0 = max(y - radius, 0)
+    x1 = min(x + radius, MAP_SIZE - 1)
+    y1 = min(y + radius, MAP_SIZE - 1)
+
+    px, py = np.nonzero(~grid[x0:x1 + 1, y0:y1 + 1])
+    px = px + x0
+    py = py + y0
+
+    return np.stack((px, py), axis=1), np.abs(px - x) + np.abs(py - y)
+
+
+def warm_up_kernels() -> None:
+    """Compile the JIT kernels up front so the first game turn doesn't pay for it."""
+    _scan_unexplored(np.zeros((MAP_SIZE, MAP_SIZE), dtype=np.bool_), 0, 0, 1)
+
+
+class _ExplorationStatus(Mapping):
+    """Read-only exploration stats whose nearby tile scan runs on first access."""
+
+    __slots__ = ('_stats', '_memory', '_position', '_nearby')
+
+    _KEYS = ('map_id', 'explored_count', 'total_tiles', 'exploration_percent', 'nearby_unexplored')
+
+    def __init__(self, stats: Dict[str, Any], memory: 'MapMemory',
+                 position: Optional[Tuple[int, int]]):
+        """Initialize stats.
+
+        Args:
+            stats: Every stat except nearby_unexplored
+            memory: Map memory to scan
+            position: Position to scan around (None = no nearby tiles)
+        """
+        self._stats = stats
+        self._memory = memory
+        self._position = position
+        self._nearby: Optional[List[Tuple[int, int]]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key != 'nearby_unexplored':
+            return self._stats[key]
+        if self._nearby is None:
+            if self._position is None:
+                self._nearby = []
+            else:
+                self._nearby = self._memory.get_unexplored_adjacent(
+                    self._stats['map_id'], self._position[0], self._position[1], radius=5, limit=10
+                )
+        return self._nearby
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class MapMemory:
@@ -21,8 +112,16 @@ class MapMemory:
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
 
-        # Map ID -> Set of (x, y) tuples for explored tiles
-        self.explored_tiles: Dict[int, Set[Tuple[int, int]]] = defaultdict(set)
+        # Map ID -> MAP_SIZE x MAP_SIZE bool grid of explored tiles, indexed [x, y].
+        # Each grid is a view of a memory-mapped map_<id>.bin file, so marking a
+        # tile is a single byte store and the OS writes dirty pages back.
+        self.explored_tiles: Dict[int, np.ndarray] = {}
+
+        # Map ID -> mapping backing its grid
+        self._buffers: Dict[int, mmap.mmap] = {}
+
+        # Map ID -> number of explored tiles, kept alongside the grids
+        self._explored_counts: Dict[int, int] = {}
 
         # Map ID -> Dict of map properties
         self.map_properties: Dict[int, Dict[str, Any]] = {}
@@ -47,14 +146,11 @@ class MapMemory:
         self.current_position = (x, y)
 
         # Mark current tile as explored
-        self.explored_tiles[map_id].add((x, y))
-
-        # Also mark adjacent tiles as visible (but not necessarily explored)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                adj_x, adj_y = x + dx, y + dy
-                # Don't mark as fully explored, just visible
-                # This creates a fog-of-war effect
+        if 0 <= x < MAP_SIZE and 0 <= y < MAP_SIZE:
+            grid = self._get_grid(map_id)
+            if not grid[x, y]:
+                grid[x, y] = True
+                self._explored_counts[map_id] += 1
 
     def is_tile_explored(self, map_id: int, x: int, y: int) -> bool:
         """Check if a tile has been explored.
@@ -67,7 +163,10 @@ class MapMemory:
         Returns:
             True if explored
         """
-        return (x, y) in self.explored_tiles.get(map_id, set())
+        grid = self.explored_tiles.get(map_id)
+        if grid is None or not (0 <= x < MAP_SIZE and 0 <= y < MAP_SIZE):
+            return False
+        return bool(grid[x, y])
 
     def get_explored_tiles(self, map_id: int) -> List[Tuple[int, int]]:
         """Get all explored tiles for a map.
@@ -78,68 +177,113 @@ class MapMemory:
         Returns:
             List of (x, y) tuples
         """
-        return list(self.explored_tiles.get(map_id, set()))
+        grid = self.explored_tiles.get(map_id)
+        if grid is None:
+            return []
+        return [(x, y) for x, y in np.argwhere(grid).tolist()]
 
     def get_unexplored_adjacent(self, map_id: int, x: int, y: int,
-                                radius: int = 5) -> List[Tuple[int, int]]:
-        """Get unexplored tiles near a position.
+                                radius: int = 5, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Get unexplored tiles near a position, nearest first.
 
         Args:
             map_id: Map ID
             x: Center X coordinate
             y: Center Y coordinate
             radius: Search radius
+            limit: Return at most this many tiles (default: all)
 
         Returns:
             List of unexplored (x, y) positions
         """
-        unexplored = []
-        explored_set = self.explored_tiles.get(map_id, set())
+        grid = self.explored_tiles.get(map_id)
+        if grid is None:
+            grid = np.zeros((MAP_SIZE, MAP_SIZE), dtype=np.bool_)
 
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                pos = (x + dx, y + dy)
-                if pos not in explored_set:
-                    # Basic bounds check (maps are typically 0-255)
-                    if 0 <= pos[0] <= 255 and 0 <= pos[1] <= 255:
-                        unexplored.append(pos)
+        positions, dist = _scan_unexplored(grid, x, y, radius)
 
-        # Sort by distance from current position
-        unexplored.sort(key=lambda p: abs(p[0] - x) + abs(p[1] - y))
+        # Stable sort keeps scan order for ties, like list.sort
+        order = np.argsort(dist, kind='stable')[:limit]
+        return [(px, py) for px, py in positions[order].tolist()]
 
-        return unexplored
+    def _get_grid(self, map_id: int) -> np.ndarray:
+        """Get the explored-tile grid for a map, creating it if needed.
 
-    def get_exploration_status(self, map_id: int) -> Dict[str, Any]:
+        Args:
+            map_id: Map ID
+
+        Returns:
+            Bool grid indexed [x, y]
+        """
+        grid = self.explored_tiles.get(map_id)
+        if grid is None:
+            grid = self._map_grid(map_id)
+            self.explored_tiles[map_id] = grid
+            self._explored_counts[map_id] = int(np.count_nonzero(grid))
+        return grid
+
+    def _map_grid(self, map_id: int) -> np.ndarray:
+        """Map a grid file into memory, creating it if needed.
+
+        Args:
+            map_id: Map ID
+
+        Returns:
+            Bool grid indexed [x, y], backed by map_<id>.bin
+        """
+        buf = self._buffers.get(map_id)
+        if buf is None:
+            fd = os.open(self._grid_path(map_id), os.O_RDWR | os.O_CREAT)
+            try:
+                if os.fstat(fd).st_size != _GRID_BYTES:
+                    os.ftruncate(fd, _GRID_BYTES)
+                buf = mmap.mmap(fd, _GRID_BYTES)
+            finally:
+                # The mapping keeps its own reference to the file
+                os.close(fd)
+            self._buffers[map_id] = buf
+
+        return np.frombuffer(buf, dtype=np.uint8).reshape(MAP_SIZE, MAP_SIZE).view(np.bool_)
+
+    def _grid_path(self, map_id: int) -> Path:
+        """Get the path of a map's grid file.
+
+        Args:
+            map_id: Map ID
+
+        Returns:
+            Grid file path
+        """
+        return self.save_dir / f"map_{map_id}.bin"
+
+    def get_exploration_status(self, map_id: int) -> Mapping:
         """Get exploration statistics for a map.
 
+        The 'nearby_unexplored' entry (top 10 nearest unexplored tiles) is only
+        scanned when first read, so read it before exploring further.
+
         Args:
             map_id: Map ID
 
         Returns:
-            Dict with exploration stats
+            Read-only mapping with exploration stats
         """
-        explored = self.explored_tiles.get(map_id, set())
-        nearby_unexplored = []
+        explored_count = self._explored_counts.get(map_id, 0)
 
+        position = None
         if self.current_map == map_id and self.current_position:
-            nearby_unexplored = self.get_unexplored_adjacent(
-                map_id,
-                self.current_position[0],
-                self.current_position[1],
-                radius=5
-            )
+            position = self.current_position
 
         # Estimate total tiles (typical Pokemon Red map is 10x9 to 20x18)
         # We'll use explored count as a lower bound
-        estimated_total = max(len(explored), 200)  # Rough estimate
+        estimated_total = max(explored_count, 200)  # Rough estimate
 
-        return {
+        return _ExplorationStatus({
             'map_id': map_id,
-            'explored_count': len(explored),
+            'explored_count': explored_count,
             'total_tiles': estimated_total,
-            'exploration_percent': len(explored) / estimated_total * 100,
-            'nearby_unexplored': nearby_unexplored[:10],  # Top 10 nearest
-        }
+            'exploration_percent': explored_count / estimated_total * 100,
+        }, self, position)
 
     def get_all_explored_maps(self) -> List[int]:
         """Get list of all explored map IDs.
@@ -149,61 +293,138 @@ class MapMemory:
         """
         return list(self.explored_tiles.keys())
 
-    def save(self) -> None:
-        """Save map memory to disk."""
-        save_file = self.save_dir / "map_memory.json"
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy map memory for saving.
+
+        Explored tiles already live in their grid files, so only the map
+        properties need copying before save() runs on another thread.
 
-        # Convert sets to lists for JSON serialization
-        data = {
-            'explored_tiles': {
-                str(map_id): [list(pos) for pos in tiles]
-                for map_id, tiles in self.explored_tiles.items()
+        Returns:
+            Dict with copied map properties
+        """
+        return {
+            'map_properties': {
+                map_id: dict(props) for map_id, props in self.map_properties.items()
             },
-            'map_properties': self.map_properties,
         }
 
-        with open(save_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    def save(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Save map memory to disk.
 
-        self.logger.debug(f"Saved map memory to {save_file}")
+        Grid writes already reach the files through the memory mappings; this
+        forces them out and writes the map properties.
 
-    def load(self) -> None:
-        """Load map memory from disk."""
-        save_file = self.save_dir / "map_memory.json"
+        Args:
+            data: Snapshot from snapshot() (default: take one now)
+        """
+        if data is None:
+            data = self.snapshot()
 
-        if not save_file.exists():
-            self.logger.info("No saved map memory found, starting fresh")
-            return
+        for buf in list(self._buffers.values()):
+            buf.flush()
 
-        try:
-            with open(save_file, 'r') as f:
-                data = json.load(f)
+        save_file = self.save_dir / "map_properties.json"
+        save_file.write_bytes(json_io.dumps(data['map_properties']))
 
-            # Convert lists back to sets
-            self.explored_tiles = defaultdict(set)
-            for map_id_str, tiles in data.get('explored_tiles', {}).items():
-                map_id = int(map_id_str)
-                self.explored_tiles[map_id] = set(tuple(pos) for pos in tiles)
+        self.logger.debug("Saved map memory to %s", self.save_dir)
 
-            self.map_properties = data.get('map_properties', {})
+    def load(self) -> None:
+        """Load map memory from disk."""
+        grid_files = sorted(self.save_dir.glob("map_*.bin"))
+        properties_file = self.save_dir / "map_properties.json"
+
+        try:
+            self.explored_tiles = {}
+            self._explored_counts = {}
+
+            for path in grid_files:
+                try:
+                    map_id = int(path.stem[len("map_"):])
+                except ValueError:
+                    continue
+                grid = self._map_grid(map_id)
+                count = int(np.count_nonzero(grid))
+                # Maps cleared by reset_map() keep their file but stay unexplored
+                if count:
+                    self.explored_tiles[map_id] = grid
+                    self._explored_counts[map_id] = count
+
+            if properties_file.exists():
+                self.map_properties = json_io.loads(properties_file.read_bytes())
+
+            if not grid_files and self._migrate_legacy():
+                self.logger.info("Migrated saved map memory to grid files")
+
+            if not self.explored_tiles:
+                self.logger.info("No saved map memory found, starting fresh")
+                return
 
             self.logger.info(f"Loaded map memory: {len(self.explored_tiles)} maps explored")
 
         except Exception as e:
             self.logger.error(f"Failed to load map memory: {e}")
 
+    def _migrate_legacy(self) -> bool:
+        """Copy map memory from the older map_memory.json into grid files.
+
+        The old file is left in place.
+
+        Returns:
+            True if anything was migrated
+        """
+        legacy_file = self.save_dir / "map_memory.json"
+        if not legacy_file.exists():
+            return False
+
+        # Explored tiles were stored as lists of (x, y) pairs
+        data = json_io.loads(legacy_file.read_bytes())
+
+        for map_id_str, tiles in data.get('explored_tiles', {}).items():
+            grid = self._get_grid(int(map_id_str))
+            for x, y in tiles:
+                if 0 <= x < MAP_SIZE and 0 <= y < MAP_SIZE:
+                    grid[x, y] = True
+
+        self.map_properties = data.get('map_properties', {})
+
+        for map_id, grid in self.explored_tiles.items():
+            self._explored_counts[map_id] = int(np.count_nonzero(grid))
+
+        self.save()
+        return True
+
+    def close(self) -> None:
+        """Flush the grid files and release their mappings."""
+        for buf in self._buffers.values():
+            buf.flush()
+
+        # Mappings can only be closed once no grid views remain
+        self.explored_tiles.clear()
+        self._explored_counts.clear()
+        for buf in self._buffers.values():
+            try:
+                buf.close()
+            except BufferError:
+                pass
+        self._buffers.clear()
+
     def reset_map(self, map_id: int) -> None:
         """Reset exploration for a specific map.
 
         Args:
             map_id: Map ID to reset
         """
-        if map_id in self.explored_tiles:
-            del self.explored_tiles[map_id]
+        grid = self.explored_tiles.pop(map_id, None)
+        if grid is not None:
+            grid[:] = False
+        self._explored_counts.pop(map_id, None)
         self.logger.info(f"Reset exploration for map {map_id}")
 
     def reset_all(self) -> None:
         """Reset all exploration data."""
+        for grid in self.explored_tiles.values():
+            grid[:] = False
         self.explored_tiles.clear()
+        self._explored_counts.clear()
         self.map_properties.clear()
         self.logger.info("Reset all map memory")
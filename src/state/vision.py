@@ -18,6 +18,15 @@ class VisionProcessor:
     def __init__(self):
         """Initialize vision processor."""
         self.logger = get_logger('Vision')
+
+        # Constant per-frame results and the grid overlay, built once
+        self._grid_pos = (
+            (self.SCREEN_WIDTH // 2) // self.GRID_SIZE,
+            (self.SCREEN_HEIGHT // 2) // self.GRID_SIZE,
+        )
+        self._screen_size = (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        self._grid_overlay = self._build_grid_overlay()
+
         self.logger.info("Vision processor initialized")
 
     def analyze_screen(self, screen_image: Image.Image) -> Dict[str, Any]:
@@ -29,68 +38,81 @@ class VisionProcessor:
         Returns:
             Dict with visual analysis
         """
-        # Get grid position (center tile)
-        grid_x = (self.SCREEN_WIDTH // 2) // self.GRID_SIZE
-        grid_y = (self.SCREEN_HEIGHT // 2) // self.GRID_SIZE
-
-        # Detect screen elements
-        elements = self._detect_elements(screen_image)
+        # Detect screen elements from one raw copy of the pixels
+        elements = self._detect_elements(self._to_array(screen_image))
 
         # Generate description
         description = self._generate_description(screen_image, elements)
 
         return {
-            'grid_position': (grid_x, grid_y),
+            'grid_position': self._grid_pos,
             'elements': elements,
             'description': description,
-            'screen_size': (screen_image.width, screen_image.height),
+            'screen_size': self._screen_size,
         }
 
-    def _detect_elements(self, image: Image.Image) -> List[str]:
+    @staticmethod
+    def _to_array(image: Image.Image) -> np.ndarray:
+        """Copy an 8-bit image into a numpy array with a single memcpy.
+
+        Args:
+            image: Screen image (L, RGB or RGBA)
+
+        Returns:
+            (H, W) or (H, W, C) uint8 array
+        """
+        bands = len(image.getbands())
+        shape = (image.height, image.width) if bands == 1 else (image.height, image.width, bands)
+        return np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(shape)
+
+    def _detect_elements(self, img_array: np.ndarray) -> List[str]:
         """Detect UI elements on screen.
 
         Args:
-            image: Screen image
+            img_array: Screen pixels from _to_array
 
         Returns:
             List of detected elements
         """
         elements = []
 
-        # Convert to numpy array for analysis
-        img_array = np.array(image)
+        # One pass over the pixels: approximate luma from the RGB channels
+        # (alpha, if present, is ignored); every heuristic below reads it
+        if img_array.ndim == 2:
+            luma = img_array
+        else:
+            luma = (img_array[..., 0] >> 2) + (img_array[..., 1] >> 1) + (img_array[..., 2] >> 2)
 
         # Simple heuristics for element detection
         # Check for text boxes (dark areas at bottom)
-        bottom_region = img_array[-40:, :, :]
-        if np.mean(bottom_region) < 50:  # Dark region
+        if luma[-40:].mean() < 50:  # Dark region
             elements.append("text_box")
 
-        # Check for menu (white background regions)
-        white_pixels = np.sum(np.all(img_array > 200, axis=2))
-        total_pixels = img_array.shape[0] * img_array.shape[1]
-        if white_pixels / total_pixels > 0.3:
+        # Check for menu (white background regions). Game Boy colors are
+        # near-monochrome, so bright luma stands in for all-channels-bright;
+        # every 4th pixel is plenty for a fraction-of-screen test.
+        if (luma[::4, ::4] > 200).mean() > 0.3:
             elements.append("menu")
 
         # Check for battle (specific color patterns)
         # Pokemon battles have distinctive layouts
-        if self._is_battle_screen(img_array):
+        if self._is_battle_screen(luma):
             elements.append("battle")
 
         return elements
 
-    def _is_battle_screen(self, img_array: np.ndarray) -> bool:
+    def _is_battle_screen(self, luma: np.ndarray) -> bool:
         """Detect if current screen is a battle.
 
         Args:
-            img_array: Screen image as numpy array
+            luma: Screen luma as a 2D uint8 array
 
         Returns:
             True if battle screen
         """
         # Check for HP bars (horizontal lines in specific regions)
         # This is a simplified heuristic
-        top_region = img_array[:60, :, :]
+        top_region = luma[:60]
 
         # Look for patterns typical in battle screens
         # (This would need more sophisticated detection in production)
@@ -120,38 +142,45 @@ class VisionProcessor:
 
         return "; ".join(descriptions)
 
-    def add_grid_overlay(self, image: Image.Image) -> Image.Image:
-        """Add grid overlay to image for visualization.
-
-        Args:
-            image: Original image
+    def _build_grid_overlay(self) -> Image.Image:
+        """Draw the grid and center-tile highlight onto a transparent layer.
 
         Returns:
-            Image with grid overlay
+            RGBA overlay image
         """
-        # Create a copy
-        img_with_grid = image.copy()
-        draw = ImageDraw.Draw(img_with_grid)
+        overlay = Image.new('RGBA', (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
 
         # Draw vertical lines
         for x in range(0, self.SCREEN_WIDTH, self.GRID_SIZE):
-            draw.line([(x, 0), (x, self.SCREEN_HEIGHT)], fill=(255, 0, 0), width=1)
+            draw.line([(x, 0), (x, self.SCREEN_HEIGHT)], fill=(255, 0, 0, 255), width=1)
 
         # Draw horizontal lines
         for y in range(0, self.SCREEN_HEIGHT, self.GRID_SIZE):
-            draw.line([(0, y), (self.SCREEN_WIDTH, y)], fill=(255, 0, 0), width=1)
+            draw.line([(0, y), (self.SCREEN_WIDTH, y)], fill=(255, 0, 0, 255), width=1)
 
         # Highlight center tile
-        center_x = (self.SCREEN_WIDTH // 2) // self.GRID_SIZE * self.GRID_SIZE
-        center_y = (self.SCREEN_HEIGHT // 2) // self.GRID_SIZE * self.GRID_SIZE
+        center_x = self._grid_pos[0] * self.GRID_SIZE
+        center_y = self._grid_pos[1] * self.GRID_SIZE
 
         draw.rectangle(
             [center_x, center_y, center_x + self.GRID_SIZE, center_y + self.GRID_SIZE],
-            outline=(0, 255, 0),
+            outline=(0, 255, 0, 255),
             width=2
         )
 
-        return img_with_grid
+        return overlay
+
+    def add_grid_overlay(self, image: Image.Image) -> Image.Image:
+        """Add grid overlay to image for visualization.
+
+        Args:
+            image: Original image
+
+        Returns:
+            New RGBA image with grid overlay
+        """
+        return Image.alpha_composite(image.convert('RGBA'), self._grid_overlay)
 
     def save_annotated_screenshot(self, image: Image.Image, filepath: str) -> None:
         """Save screenshot with annotations.
@@ -162,4 +191,4 @@ class VisionProcessor:
         """
         annotated = self.add_grid_overlay(image)
         annotated.save(filepath)
-        self.logger.debug(f"Saved annotated screenshot to {filepath}")
+        self.logger.debug("Saved annotated screenshot to %s", filepath)
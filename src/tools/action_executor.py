@@ -1,6 +1,8 @@
 """Action executor for translating decisions to button presses."""
 
-from typing import List, Optional
+from typing import List, Optional, Deque
+from collections import deque
+from itertools import islice
 import time
 
 from ..emulator.game_boy import GameBoyEmulator
@@ -29,13 +31,20 @@ class ActionExecutor:
         self.logger = get_logger('ActionExecutor')
 
         self.action_delay = self.config.get('actions.delay_ms', 100) / 1000.0
-        self.last_actions: List[str] = []
         self.stuck_threshold = self.config.get('actions.stuck_threshold', 10)
+        self.last_actions: Deque[str] = deque(maxlen=self.stuck_threshold)
+
+        # Running lengths of the trailing repeat (AAAA) and alternation (ABAB) runs
+        self._same_tail = 0
+        self._alt_tail = 0
 
         self.logger.info("Action executor initialized")
 
     def execute(self, action: str) -> bool:
-        """Execute an action.
+        """Execute an action, blocking through the inter-action delay.
+
+        The sleeps release the GIL, so the AI, visualization and checkpoint
+        threads keep running meanwhile.
 
         Args:
             action: Action to execute
@@ -43,19 +52,10 @@ class ActionExecutor:
         Returns:
             True if successful
         """
-        action = action.lower().strip()
-
-        if action not in self.VALID_ACTIONS:
-            self.logger.warning(f"Invalid action: {action}")
+        action = self._begin_action(action)
+        if action is None:
             return False
 
-        self.logger.action(action)
-
-        # Track for stuck detection
-        self.last_actions.append(action)
-        if len(self.last_actions) > self.stuck_threshold:
-            self.last_actions.pop(0)
-
         # Execute the action
         if action == 'wait':
             time.sleep(0.5)
@@ -67,6 +67,34 @@ class ActionExecutor:
 
         return True
 
+    def _begin_action(self, action: str) -> Optional[str]:
+        """Validate, log, and record an action for stuck detection.
+
+        Args:
+            action: Action to execute
+
+        Returns:
+            Normalized action, or None if invalid
+        """
+        action = action.lower().strip()
+
+        if action not in self.VALID_ACTIONS:
+            self.logger.warning(f"Invalid action: {action}")
+            return None
+
+        self.logger.action(action)
+
+        # Track for stuck detection
+        last = self.last_actions
+        self._same_tail = self._same_tail + 1 if last and last[-1] == action else 1
+        if len(last) >= 2 and last[-2] == action:
+            self._alt_tail += 1
+        else:
+            self._alt_tail = 2 if last else 1
+        last.append(action)
+
+        return action
+
     def execute_sequence(self, actions: List[str]) -> bool:
         """Execute a sequence of actions.
 
@@ -90,27 +118,24 @@ class ActionExecutor:
         Returns:
             True if stuck
         """
-        if len(self.last_actions) < self.stuck_threshold:
-            return False
-
         # Check if all recent actions are the same
-        if len(set(self.last_actions)) == 1:
-            self.logger.warning(f"Stuck detected: repeating '{self.last_actions[0]}' {len(self.last_actions)} times")
+        if self._same_tail >= self.stuck_threshold:
+            self.logger.warning(f"Stuck detected: repeating '{self.last_actions[-1]}' {self._same_tail} times")
             return True
 
         # Check if alternating between two actions
-        if len(set(self.last_actions)) == 2:
-            # Could be stuck in a loop
-            pattern = self.last_actions[-4:]
-            if pattern[0] == pattern[2] and pattern[1] == pattern[3]:
-                self.logger.warning(f"Stuck detected: alternating pattern {pattern}")
-                return True
+        if self._alt_tail >= self.stuck_threshold:
+            pattern = list(islice(self.last_actions, max(len(self.last_actions) - 4, 0), None))
+            self.logger.warning(f"Stuck detected: alternating pattern {pattern}")
+            return True
 
         return False
 
     def reset_stuck_detection(self) -> None:
         """Reset stuck detection history."""
         self.last_actions.clear()
+        self._same_tail = 0
+        self._alt_tail = 0
         self.logger.debug("Reset stuck detection")
 
     def get_action_history(self, n: int = 10) -> List[str]:
@@ -122,4 +147,4 @@ class ActionExecutor:
         Returns:
             List of recent actions
         """
-        return self.last_actions[-n:]
+        return list(islice(self.last_actions, max(len(self.last_actions) - n, 0), None))
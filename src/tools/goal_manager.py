@@ -1,15 +1,21 @@
 """Goal manager for tracking objectives."""
 
+import sys
+from itertools import islice
 from typing import Optional, Dict, List
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
-import json
 from pathlib import Path
 
 from ..utils.logger import get_logger
+from ..utils import json_io
 
 
-@dataclass
+# slots=True needs Python 3.10; older versions keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Goal:
     """Represents a goal."""
     goal_type: str  # 'primary', 'secondary', 'tertiary'
@@ -22,6 +28,13 @@ class Goal:
 class GoalManager:
     """Manages primary, secondary, and tertiary goals."""
 
+    # Goal type -> attribute holding that goal
+    _GOAL_ATTRS = {
+        'primary': 'primary_goal',
+        'secondary': 'secondary_goal',
+        'tertiary': 'tertiary_goal',
+    }
+
     def __init__(self):
         """Initialize goal manager."""
         self.logger = get_logger('GoalManager')
@@ -33,6 +46,11 @@ class GoalManager:
         # Goal history
         self.completed_goals: List[Goal] = []
 
+        # Rendered goals text, reused until the goals change
+        self._version = 0
+        self._cache_v = -1
+        self._cache_s = ""
+
         self.logger.info("Goal manager initialized")
 
     def set_primary_goal(self, description: str) -> None:
@@ -41,16 +59,7 @@ class GoalManager:
         Args:
             description: Goal description
         """
-        # Complete old goal if exists
-        if self.primary_goal and not self.primary_goal.completed:
-            self.complete_goal('primary')
-
-        self.primary_goal = Goal(
-            goal_type='primary',
-            description=description,
-            created_at=datetime.now().isoformat()
-        )
-
+        self._set_goal('primary', description)
         self.logger.milestone(f"NEW PRIMARY GOAL: {description}")
 
     def set_secondary_goal(self, description: str) -> None:
@@ -59,15 +68,7 @@ class GoalManager:
         Args:
             description: Goal description
         """
-        if self.secondary_goal and not self.secondary_goal.completed:
-            self.complete_goal('secondary')
-
-        self.secondary_goal = Goal(
-            goal_type='secondary',
-            description=description,
-            created_at=datetime.now().isoformat()
-        )
-
+        self._set_goal('secondary', description)
         self.logger.info(f"NEW SECONDARY GOAL: {description}")
 
     def set_tertiary_goal(self, description: str) -> None:
@@ -76,16 +77,24 @@ class GoalManager:
         Args:
             description: Goal description
         """
-        if self.tertiary_goal and not self.tertiary_goal.completed:
-            self.complete_goal('tertiary')
+        self._set_goal('tertiary', description)
+        self.logger.info(f"NEW TERTIARY GOAL: {description}")
+
+    def _set_goal(self, goal_type: str, description: str) -> None:
+        """Replace a goal, completing the old one if it is still open.
+
+        Args:
+            goal_type: 'primary', 'secondary', or 'tertiary'
+            description: Goal description
+        """
+        self.complete_goal(goal_type)
 
-        self.tertiary_goal = Goal(
-            goal_type='tertiary',
+        setattr(self, self._GOAL_ATTRS[goal_type], Goal(
+            goal_type=goal_type,
             description=description,
             created_at=datetime.now().isoformat()
-        )
-
-        self.logger.info(f"NEW TERTIARY GOAL: {description}")
+        ))
+        self._version += 1
 
     def complete_goal(self, goal_type: str) -> None:
         """Mark a goal as completed.
@@ -93,18 +102,14 @@ class GoalManager:
         Args:
             goal_type: 'primary', 'secondary', or 'tertiary'
         """
-        goal = None
-        if goal_type == 'primary':
-            goal = self.primary_goal
-        elif goal_type == 'secondary':
-            goal = self.secondary_goal
-        elif goal_type == 'tertiary':
-            goal = self.tertiary_goal
+        attr = self._GOAL_ATTRS.get(goal_type)
+        goal = getattr(self, attr) if attr else None
 
         if goal and not goal.completed:
             goal.completed = True
             goal.completed_at = datetime.now().isoformat()
             self.completed_goals.append(goal)
+            self._version += 1
 
             self.logger.milestone(f"COMPLETED {goal_type.upper()} GOAL: {goal.description}")
 
@@ -126,49 +131,60 @@ class GoalManager:
         Returns:
             Formatted goals text
         """
-        text = "=== CURRENT GOALS ===\n"
+        if self._cache_v == self._version:
+            return self._cache_s
 
-        if self.primary_goal:
-            text += f"PRIMARY: {self.primary_goal.description}\n"
-        else:
-            text += "PRIMARY: Not set\n"
+        parts = ["=== CURRENT GOALS ==="]
 
-        if self.secondary_goal:
-            text += f"SECONDARY: {self.secondary_goal.description}\n"
-        else:
-            text += "SECONDARY: Not set\n"
-
-        if self.tertiary_goal:
-            text += f"TERTIARY: {self.tertiary_goal.description}\n"
-        else:
-            text += "TERTIARY: Not set\n"
+        for goal_type, attr in self._GOAL_ATTRS.items():
+            goal = getattr(self, attr)
+            parts.append(f"{goal_type.upper()}: {goal.description if goal else 'Not set'}")
 
         if self.completed_goals:
-            text += f"\nCOMPLETED GOALS: {len(self.completed_goals)}\n"
+            parts.append("")
+            parts.append(f"COMPLETED GOALS: {len(self.completed_goals)}")
             # Show last 3 completed goals
-            for goal in self.completed_goals[-3:]:
-                text += f"  ✓ {goal.description}\n"
+            for goal in islice(self.completed_goals, max(len(self.completed_goals) - 3, 0), None):
+                parts.append(f"  ✓ {goal.description}")
+
+        parts.append("")
+        text = "\n".join(parts)
 
+        self._cache_v = self._version
+        self._cache_s = text
         return text
 
-    def save(self, filepath: str) -> None:
+    def snapshot(self) -> Dict:
+        """Copy the goals into a JSON-ready dict.
+
+        Returns:
+            Serializable goal data
+        """
+        def copy(goal: Optional[Goal]) -> Optional[Dict]:
+            return None if goal is None else asdict(goal)
+
+        return {
+            'primary': copy(self.primary_goal),
+            'secondary': copy(self.secondary_goal),
+            'tertiary': copy(self.tertiary_goal),
+            'completed': [asdict(goal) for goal in self.completed_goals],
+        }
+
+    def save(self, filepath: str, data: Optional[Dict] = None, pretty: bool = False) -> None:
         """Save goals to file.
 
         Args:
             filepath: Path to save file
+            data: Snapshot from snapshot() (default: take one now)
+            pretty: Indent the JSON for reading by hand
         """
-        data = {
-            'primary': self._goal_to_dict(self.primary_goal),
-            'secondary': self._goal_to_dict(self.secondary_goal),
-            'tertiary': self._goal_to_dict(self.tertiary_goal),
-            'completed': [self._goal_to_dict(g) for g in self.completed_goals],
-        }
+        if data is None:
+            data = self.snapshot()
 
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(filepath).write_bytes(json_io.dumps(data, indent=pretty))
 
-        self.logger.debug(f"Saved goals to {filepath}")
+        self.logger.debug("Saved goals to %s", filepath)
 
     def load(self, filepath: str) -> None:
         """Load goals from file.
@@ -180,28 +196,16 @@ class GoalManager:
             self.logger.warning(f"Goals file not found: {filepath}")
             return
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = json_io.loads(Path(filepath).read_bytes())
 
         self.primary_goal = self._dict_to_goal(data.get('primary'))
         self.secondary_goal = self._dict_to_goal(data.get('secondary'))
         self.tertiary_goal = self._dict_to_goal(data.get('tertiary'))
         self.completed_goals = [self._dict_to_goal(g) for g in data.get('completed', [])]
+        self._version += 1
 
         self.logger.info(f"Loaded goals from {filepath}")
 
-    def _goal_to_dict(self, goal: Optional[Goal]) -> Optional[Dict]:
-        """Convert goal to dict."""
-        if goal is None:
-            return None
-        return {
-            'goal_type': goal.goal_type,
-            'description': goal.description,
-            'created_at': goal.created_at,
-            'completed': goal.completed,
-            'completed_at': goal.completed_at,
-        }
-
     def _dict_to_goal(self, data: Optional[Dict]) -> Optional[Goal]:
         """Convert dict to goal."""
         if data is None:
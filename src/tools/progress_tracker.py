@@ -1,11 +1,11 @@
 """Progress tracker for monitoring game advancement."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
-import json
 from pathlib import Path
 
 from ..utils.logger import get_logger
+from ..utils import json_io
 
 
 class ProgressTracker:
@@ -26,6 +26,10 @@ class ProgressTracker:
         self.pokemon_caught: List[str] = []
         self.key_items_obtained: List[str] = []
         self.gyms_defeated: List[str] = []
+
+        # Membership sets for the lists checked every turn
+        self._badges_set: Set[str] = set()
+        self._pokemon_set: Set[str] = set()
         self.elite_four_defeated: bool = False
         self.champion_defeated: bool = False
 
@@ -38,6 +42,11 @@ class ProgressTracker:
         # Turn markers for major events
         self.milestone_turns: Dict[str, int] = {}
 
+        # Progress summary text below the header, reused until progress changes
+        self._version = 0
+        self._cache_v = -1
+        self._cache_s = ""
+
         self.logger.info("Progress tracker initialized")
 
     def update(self, turn: int, game_state: Dict[str, Any]) -> None:
@@ -52,17 +61,21 @@ class ProgressTracker:
         # Check badges
         badges = game_state.get('memory', {}).get('badges', {})
         for badge_name, obtained in badges.items():
-            if obtained and badge_name not in self.badges_earned:
+            if obtained and badge_name not in self._badges_set:
+                self._badges_set.add(badge_name)
                 self.badges_earned.append(badge_name)
                 self.milestone_turns[f"badge_{badge_name}"] = turn
+                self._version += 1
                 self.logger.milestone(f"EARNED BADGE: {badge_name} (Turn {turn})")
 
         # Check party for new Pokemon
         party = game_state.get('memory', {}).get('party', [])
         for pokemon in party:
             species = pokemon.get('species', 'Unknown')
-            if species not in self.pokemon_caught:
+            if species not in self._pokemon_set:
+                self._pokemon_set.add(species)
                 self.pokemon_caught.append(species)
+                self._version += 1
                 self.logger.info(f"New Pokemon: {species}")
 
     def get_progress_summary(self) -> str:
@@ -71,26 +84,29 @@ class ProgressTracker:
         Returns:
             Progress summary text
         """
-        elapsed = datetime.now() - self.start_time
-        hours = elapsed.total_seconds() / 3600
-
-        summary = f"""=== PROGRESS SUMMARY ===
-Time Elapsed: {hours:.1f} hours
-Total Turns: {self.total_turns}
-
-Badges: {len(self.badges_earned)}/8
-{', '.join(self.badges_earned) if self.badges_earned else 'None yet'}
-
-Pokemon Caught: {len(self.pokemon_caught)}
-{', '.join(self.pokemon_caught[:10])}{'...' if len(self.pokemon_caught) > 10 else ''}
-
-"""
-        if self.milestone_turns:
-            summary += "Major Milestones:\n"
-            for milestone, turn in sorted(self.milestone_turns.items(), key=lambda x: x[1]):
-                summary += f"  {milestone}: Turn {turn}\n"
-
-        return summary
+        hours = (datetime.now() - self.start_time).total_seconds() / 3600
+        header = f"=== PROGRESS SUMMARY ===\nTime Elapsed: {hours:.1f} hours\nTotal Turns: {self.total_turns}\n"
+
+        if self._cache_v != self._version:
+            parts = [
+                "",
+                f"Badges: {len(self.badges_earned)}/8",
+                ', '.join(self.badges_earned) if self.badges_earned else 'None yet',
+                "",
+                f"Pokemon Caught: {len(self.pokemon_caught)}",
+                ', '.join(self.pokemon_caught[:10]) + ('...' if len(self.pokemon_caught) > 10 else ''),
+                "",
+            ]
+            if self.milestone_turns:
+                parts.append("Major Milestones:")
+                for milestone, turn in sorted(self.milestone_turns.items(), key=lambda x: x[1]):
+                    parts.append(f"  {milestone}: Turn {turn}")
+            parts.append("")
+
+            self._cache_v = self._version
+            self._cache_s = "\n".join(parts)
+
+        return header + self._cache_s
 
     def get_completion_percentage(self) -> float:
         """Estimate game completion percentage.
@@ -109,31 +125,42 @@ Pokemon Caught: {len(self.pokemon_caught)}
 
         return min(100, badge_progress + elite_four_progress + champion_progress)
 
-    def save(self, filepath: Optional[str] = None) -> None:
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy progress into a JSON-ready dict.
+
+        Returns:
+            Serializable progress data
+        """
+        return {
+            'badges_earned': list(self.badges_earned),
+            'pokemon_caught': list(self.pokemon_caught),
+            'key_items': list(self.key_items_obtained),
+            'gyms_defeated': list(self.gyms_defeated),
+            'elite_four_defeated': self.elite_four_defeated,
+            'champion_defeated': self.champion_defeated,
+            'total_turns': self.total_turns,
+            'total_battles': self.total_battles,
+            'milestone_turns': dict(self.milestone_turns),
+            'start_time': self.start_time.isoformat(),
+        }
+
+    def save(self, filepath: Optional[str] = None, data: Optional[Dict[str, Any]] = None,
+             pretty: bool = False) -> None:
         """Save progress to file.
 
         Args:
             filepath: Path to save file (default: auto-generated)
+            data: Snapshot from snapshot() (default: take one now)
+            pretty: Indent the JSON for reading by hand
         """
         if filepath is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filepath = str(self.save_dir / f"progress_{timestamp}.json")
 
-        data = {
-            'badges_earned': self.badges_earned,
-            'pokemon_caught': self.pokemon_caught,
-            'key_items': self.key_items_obtained,
-            'gyms_defeated': self.gyms_defeated,
-            'elite_four_defeated': self.elite_four_defeated,
-            'champion_defeated': self.champion_defeated,
-            'total_turns': self.total_turns,
-            'total_battles': self.total_battles,
-            'milestone_turns': self.milestone_turns,
-            'start_time': self.start_time.isoformat(),
-        }
+        if data is None:
+            data = self.snapshot()
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(filepath).write_bytes(json_io.dumps(data, indent=pretty))
 
         self.logger.info(f"Saved progress to {filepath}")
 
@@ -147,11 +174,12 @@ Pokemon Caught: {len(self.pokemon_caught)}
             self.logger.warning(f"Progress file not found: {filepath}")
             return
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = json_io.loads(Path(filepath).read_bytes())
 
         self.badges_earned = data.get('badges_earned', [])
         self.pokemon_caught = data.get('pokemon_caught', [])
+        self._badges_set = set(self.badges_earned)
+        self._pokemon_set = set(self.pokemon_caught)
         self.key_items_obtained = data.get('key_items', [])
         self.gyms_defeated = data.get('gyms_defeated', [])
         self.elite_four_defeated = data.get('elite_four_defeated', False)
@@ -159,6 +187,7 @@ Pokemon Caught: {len(self.pokemon_caught)}
         self.total_turns = data.get('total_turns', 0)
         self.total_battles = data.get('total_battles', 0)
         self.milestone_turns = data.get('milestone_turns', {})
+        self._version += 1
 
         start_time_str = data.get('start_time')
         if start_time_str:
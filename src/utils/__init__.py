@@ -2,5 +2,6 @@
 
 from .config import Config, get_config
 from .logger import PokemonLogger, get_logger
+from .async_runner import run_sync, submit
 
-__all__ = ['Config', 'get_config', 'PokemonLogger', 'get_logger']
+__all__ = ['Config', 'get_config', 'PokemonLogger', 'get_logger', 'run_sync', 'submit']
@@ -0,0 +1,42 @@
+"""Shared Anthropic API client for all agents."""
+
+import os
+import threading
+from typing import Optional
+
+import httpx
+from anthropic import AsyncAnthropic
+
+
+# Custom endpoint, read once at import
+BASE_URL = os.getenv('ANTHROPIC_BASE_URL')
+
+_client: Optional[AsyncAnthropic] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> AsyncAnthropic:
+    """Get the shared async client, creating it on first use.
+
+    All agents share one HTTP/2 connection pool, so TLS sessions stay warm
+    across agents. Like any async client it must only be used on the shared
+    event loop from async_runner.
+
+    Returns:
+        AsyncAnthropic client
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+            _client = AsyncAnthropic(
+                base_url=BASE_URL,
+                http_client=http_client,
+                max_retries=2,
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+    return _client
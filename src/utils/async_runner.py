@@ -0,0 +1,55 @@
+"""Shared background event loop for running coroutines from synchronous code."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use.
+
+    Async API clients keep their connection pools bound to the loop they first
+    ran on, so every coroutine that uses them must run on this one loop.
+
+    Returns:
+        Running event loop
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name='AsyncRunner', daemon=True)
+            thread.start()
+    return _loop
+
+
+def submit(coro: Coroutine) -> Future:
+    """Schedule a coroutine on the shared loop without waiting for it.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future resolved with the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the shared loop and block until it finishes.
+
+    Must not be called from the loop thread itself.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Maximum seconds to wait (None = no limit)
+
+    Returns:
+        Coroutine result
+    """
+    return submit(coro).result(timeout)
@@ -3,7 +3,16 @@
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python loader
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Cached marker for paths that don't resolve
+_MISSING = object()
 
 
 class Config:
@@ -17,15 +26,29 @@ class Config:
         """
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
+        self._mtime: Optional[float] = None
+
+        # Dot path -> resolved value (or _MISSING), cleared whenever config changes
+        self._get_cache: Dict[str, Any] = {}
         self.load()
 
-    def load(self) -> None:
-        """Load configuration from YAML file."""
+    def load(self, force: bool = False) -> None:
+        """Load configuration from YAML file.
+
+        Args:
+            force: Re-parse even if the file hasn't changed since the last load
+        """
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
+        mtime = os.path.getmtime(self.config_path)
+        if not force and mtime == self._mtime:
+            return
+
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=_SafeLoader)
+        self._mtime = mtime
+        self._get_cache.clear()
 
         self._validate()
         self._setup_directories()
@@ -70,15 +93,28 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = path.split('.')
-        value = self.config
+        try:
+            value = self._get_cache[path]
+        except KeyError:
+            value = self._get_cache[path] = self._resolve(path)
+
+        return default if value is _MISSING else value
+
+    def _resolve(self, path: str) -> Any:
+        """Walk a dot-separated path through the config.
+
+        Args:
+            path: Dot-separated path
 
-        for key in keys:
+        Returns:
+            Configuration value, or _MISSING if the path doesn't exist
+        """
+        value = self.config
+        for key in path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
-
+                return _MISSING
         return value
 
     def set(self, path: str, value: Any) -> None:
@@ -97,6 +133,7 @@ class Config:
             config = config[key]
 
         config[keys[-1]] = value
+        self._get_cache.clear()
 
     def save(self) -> None:
         """Save current configuration to file."""
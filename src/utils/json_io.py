@@ -0,0 +1,59 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the json module is used instead
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the json module doesn't handle but orjson does."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON.
+
+    Dataclasses, datetimes and numpy arrays are encoded directly, and
+    non-string keys are converted to strings.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        return json.dumps(obj, indent=2, default=_default).encode()
+    return json.dumps(obj, separators=(',', ':'), default=_default).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
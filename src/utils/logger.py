@@ -1,16 +1,86 @@
 """Logging utilities with color support."""
 
 import logging
+import os
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import colorlog
 
 
+# Handlers shared by every PokemonLogger, created on first use
+_handler_lock = threading.Lock()
+_console_handlers: Dict[int, logging.Handler] = {}
+_file_handlers: Dict[Path, logging.Handler] = {}
+
+
+def _console_handler(level: int) -> logging.Handler:
+    """Get the shared colored console handler for a level.
+
+    Args:
+        level: Logging level
+
+    Returns:
+        Console handler
+    """
+    handler = _console_handlers.get(level)
+    if handler is None:
+        handler = colorlog.StreamHandler(sys.stdout)
+        handler.setLevel(level)
+        handler.setFormatter(colorlog.ColoredFormatter(
+            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s',
+            datefmt='%H:%M:%S',
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        ))
+        _console_handlers[level] = handler
+    return handler
+
+
+def _file_handler(log_dir: Path) -> logging.Handler:
+    """Get the shared log file handler for a directory.
+
+    All loggers write to one file per process; each line carries the
+    logger name. The file is only opened on the first write.
+
+    Args:
+        log_dir: Directory for log files
+
+    Returns:
+        File handler
+    """
+    handler = _file_handlers.get(log_dir)
+    if handler is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # File handler (no colors) with UTF-8 encoding
+        handler = logging.FileHandler(
+            log_dir / f"pokemon_{timestamp}_{os.getpid()}.log",
+            encoding='utf-8',
+            errors='replace',  # Replace problematic characters
+            delay=True
+        )
+        handler.setLevel(logging.DEBUG)  # Always log everything to file
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        _file_handlers[log_dir] = handler
+    return handler
+
+
 class PokemonLogger:
     """Custom logger for Pokemon AI Agent with color support."""
 
+    # Rule printed above and below milestones
+    _BANNER = '=' * 50
+
     def __init__(self, name: str, log_dir: str = "logs", level: str = "INFO"):
         """Initialize logger.
 
@@ -31,41 +101,10 @@ class PokemonLogger:
         if self.logger.handlers:
             return
 
-        # Console handler with colors
-        console_handler = colorlog.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-
-        console_format = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s',
-            datefmt='%H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_format)
-
-        # File handler (no colors) with UTF-8 encoding
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_handler = logging.FileHandler(
-            self.log_dir / f"{name}_{timestamp}.log",
-            encoding='utf-8',
-            errors='replace'  # Replace problematic characters
-        )
-        file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_format)
-
-        # Add handlers
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # Console and file handlers are shared across loggers
+        with _handler_lock:
+            self.logger.addHandler(_console_handler(getattr(logging, level.upper())))
+            self.logger.addHandler(_file_handler(self.log_dir.resolve()))
 
     def debug(self, msg: str, *args, **kwargs) -> None:
         """Log debug message."""
@@ -96,7 +135,8 @@ class PokemonLogger:
 
     def state(self, state_type: str, data: dict) -> None:
         """Log game state information."""
-        self.debug(f"STATE[{state_type}]: {data}")
+        # Lazy %-formatting: the full state dict is only rendered if emitted
+        self.debug("STATE[%s]: %s", state_type, data)
 
     def decision(self, decision: str, reasoning: str = "") -> None:
         """Log AI decision with reasoning."""
@@ -107,9 +147,8 @@ class PokemonLogger:
 
     def milestone(self, milestone: str) -> None:
         """Log important milestones."""
-        self.info(f"{'='*50}")
-        self.info(f"MILESTONE: {milestone}")
-        self.info(f"{'='*50}")
+        # One multi-line record rather than three separate ones
+        self.logger.info("%s\nMILESTONE: %s\n%s", self._BANNER, milestone, self._BANNER)
 
 
 def get_logger(name: str, log_dir: str = "logs", level: str = "INFO") -> PokemonLogger:
@@ -0,0 +1,46 @@
+"""Bounded LRU cache for parsed agent responses."""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResponseCache:
+    """Least-recently-used cache mapping query keys to parsed AI results."""
+
+    def __init__(self, max_size: int = 512):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Look up a cached result, marking it most recently used.
+
+        Args:
+            key: Query key
+
+        Returns:
+            Cached result, or None if missing
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used entry when full.
+
+        Args:
+            key: Query key
+            value: Parsed result
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
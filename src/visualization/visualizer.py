@@ -2,25 +2,55 @@
 
 import io
 import json
-import base64
 import threading
-from typing import Dict, Any, Optional
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, Optional, Union
 from datetime import datetime
-from flask import Flask, render_template, jsonify
+import numpy as np
+from flask import Flask, Response, render_template
 from flask_socketio import SocketIO, emit
 from PIL import Image
 
 from ..utils.logger import get_logger
+from ..utils import json_io
+
+
+def _json_response(data: Any) -> Response:
+    """Build a JSON response, encoded with orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Flask response
+    """
+    return Response(json_io.dumps(data), mimetype='application/json')
+
+
+class _SocketJSON:
+    """json-module stand-in so Socket.IO packets go through json_io."""
+
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        return json_io.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data: Union[str, bytes], *args, **kwargs) -> Any:
+        return json_io.loads(data)
 
 
 class GameVisualizer:
     """Real-time web-based visualizer for AI gameplay."""
 
-    def __init__(self, port: int = 5000):
+    def __init__(self, port: int = 5000, batched: bool = True):
         """Initialize visualizer.
 
         Args:
             port: Port for web server
+            batched: Collect updates and send them in one 'turn_update' event
+                per flush() instead of one event per update
         """
         self.logger = get_logger('Visualizer')
         self.port = port
@@ -30,16 +60,29 @@ class GameVisualizer:
                          template_folder='../../templates',
                          static_folder='../../static')
         self.app.config['SECRET_KEY'] = 'pokemon-ai-secret'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", json=_SocketJSON)
 
         # Data storage
         self.current_state = {}
         self.latest_decision = {}
-        self.latest_screenshot = None
-        self.decision_history = []
+        self.latest_screenshot: Optional[bytes] = None  # Encoded WebP
+        self._now_cache = (0.0, '')  # (monotonic time, ISO timestamp)
+        self._last_image_hash = None
+        self.decision_history: Deque[Dict[str, Any]] = deque(maxlen=1000)  # Last 1000 decisions
         self.goal_stack = []
         self.exploration_data = {}
 
+        # Connected dashboard clients; nothing is broadcast while there are none
+        self._client_count = 0
+        self._client_lock = threading.Lock()
+
+        # Latest frame not yet encoded because no client was watching
+        self._raw_screenshot: Optional[Union[Image.Image, np.ndarray, bytes]] = None
+
+        # Updates waiting for the next flush() when batched
+        self.batched = batched
+        self._pending_update: Dict[str, Any] = {}
+
         # Setup routes
         self._setup_routes()
 
@@ -52,6 +95,18 @@ class GameVisualizer:
     def _setup_routes(self):
         """Setup Flask routes."""
 
+        @self.socketio.on('connect')
+        def on_connect():
+            """Count a connected dashboard client."""
+            with self._client_lock:
+                self._client_count += 1
+
+        @self.socketio.on('disconnect')
+        def on_disconnect():
+            """Forget a disconnected dashboard client."""
+            with self._client_lock:
+                self._client_count = max(self._client_count - 1, 0)
+
         @self.app.route('/')
         def index():
             """Main dashboard page."""
@@ -60,32 +115,52 @@ class GameVisualizer:
         @self.app.route('/api/state')
         def get_state():
             """Get current game state."""
-            return jsonify(self.current_state)
+            return _json_response(self.current_state)
 
         @self.app.route('/api/decision')
         def get_decision():
             """Get latest AI decision."""
-            return jsonify(self.latest_decision)
+            return _json_response(self.latest_decision)
 
         @self.app.route('/api/screenshot')
         def get_screenshot():
-            """Get latest game screenshot."""
+            """Get latest game screenshot as a WebP image."""
+            raw = self._raw_screenshot
+            if raw is not None:
+                self._raw_screenshot = None
+                self.latest_screenshot = self._encode_screenshot(raw)
             if self.latest_screenshot:
-                return jsonify({'image': self.latest_screenshot})
-            return jsonify({'image': None})
+                return Response(self.latest_screenshot, mimetype='image/webp')
+            return Response(status=204)
 
         @self.app.route('/api/history')
         def get_history():
             """Get decision history."""
-            return jsonify({
-                'decisions': self.decision_history[-50:],  # Last 50 decisions
+            return _json_response({
+                'decisions': list(islice(self.decision_history, max(len(self.decision_history) - 50, 0), None)),  # Last 50 decisions
                 'total': len(self.decision_history)
             })
 
         @self.app.route('/api/goals')
         def get_goals():
             """Get current goals."""
-            return jsonify({'goals': self.goal_stack})
+            return _json_response({'goals': self.goal_stack})
+
+    def _now_iso(self) -> str:
+        """Get the current time as an ISO string, reused for up to 250 ms.
+
+        Returns:
+            ISO-formatted timestamp
+        """
+        now = time.monotonic()
+        if now - self._now_cache[0] > 0.25:
+            self._now_cache = (now, datetime.now().isoformat())
+        return self._now_cache[1]
+
+    @property
+    def _broadcasting(self) -> bool:
+        """Whether updates should be pushed to dashboard clients."""
+        return self.running and self._client_count > 0
 
     def start(self):
         """Start visualization server in background thread."""
@@ -121,7 +196,7 @@ class GameVisualizer:
         """
         self.current_state = {
             'turn': state.get('turn', 0),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': state.get('timestamp') or self._now_iso(),
             'position': state.get('memory', {}).get('position', {}),
             'badges': state.get('memory', {}).get('badge_count', 0),
             'party_size': len(state.get('memory', {}).get('party', [])),
@@ -133,7 +208,9 @@ class GameVisualizer:
         }
 
         # Broadcast to connected clients
-        if self.running:
+        if self.batched:
+            self._pending_update['state'] = self.current_state
+        elif self._broadcasting:
             self.socketio.emit('state_update', self.current_state)
 
     def update_decision(self, action: str, reasoning: str, turn: int):
@@ -148,41 +225,79 @@ class GameVisualizer:
             'turn': turn,
             'action': action,
             'reasoning': reasoning,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
 
         self.latest_decision = decision
         self.decision_history.append(decision)
 
-        # Keep only last 1000 decisions in memory
-        if len(self.decision_history) > 1000:
-            self.decision_history = self.decision_history[-1000:]
-
         # Broadcast to connected clients
-        if self.running:
+        if self.batched:
+            self._pending_update['decision'] = decision
+        elif self._broadcasting:
             self.socketio.emit('decision_update', decision)
 
-    def update_screenshot(self, image: Image.Image):
+    def update_screenshot(self, image: Union[Image.Image, np.ndarray, bytes]):
         """Update game screenshot.
 
         Args:
-            image: PIL Image of game screen
+            image: PIL Image, raw screen array, or already-encoded WebP bytes
         """
         try:
-            # Convert PIL Image to base64
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-            self.latest_screenshot = f"data:image/png;base64,{img_str}"
-
-            # Broadcast to connected clients
-            if self.running:
-                self.socketio.emit('screenshot_update', {
-                    'image': self.latest_screenshot
-                })
+            if isinstance(image, (bytearray, memoryview)):
+                image = bytes(image)
+
+            # Nobody is watching: keep the frame and encode it only if /api/screenshot asks
+            if not self._broadcasting:
+                self._raw_screenshot = image if isinstance(image, bytes) else image.copy()
+                self._last_image_hash = None
+                return
+
+            # Identical frames (e.g. while the AI is thinking) reuse the last encoding
+            image_hash = hash(image if isinstance(image, bytes) else image.tobytes())
+            if image_hash == self._last_image_hash:
+                return
+            self._last_image_hash = image_hash
+
+            self._raw_screenshot = None
+            self.latest_screenshot = self._encode_screenshot(image)
+
+            # Broadcast to connected clients as a binary frame (no base64)
+            if self.batched:
+                self._pending_update['screenshot'] = self.latest_screenshot
+            elif self._broadcasting:
+                self.socketio.emit('screenshot_bin', self.latest_screenshot)
         except Exception as e:
             self.logger.error(f"Error updating screenshot: {e}")
 
+    @staticmethod
+    def _encode_screenshot(image: Union[Image.Image, np.ndarray, bytes]) -> bytes:
+        """Encode a screenshot for the dashboard.
+
+        Args:
+            image: PIL Image, raw screen array, or already-encoded WebP bytes
+
+        Returns:
+            WebP image bytes
+        """
+        if isinstance(image, bytes):
+            return image
+
+        # Raw screen buffers are only wrapped as images here, off the game loop.
+        # frombuffer shares the array's memory where fromarray would copy it.
+        if isinstance(image, np.ndarray):
+            if image.ndim == 3 and image.shape[2] in (3, 4) and image.flags.c_contiguous:
+                mode = 'RGBA' if image.shape[2] == 4 else 'RGB'
+                image = Image.frombuffer(mode, (image.shape[1], image.shape[0]), image, 'raw', mode, 0, 1)
+            else:
+                image = Image.fromarray(image)
+
+        # Lossless WebP at the fastest method keeps the pixel art crisp and
+        # encodes faster and smaller than PNG
+        buffered = io.BytesIO()
+        image.save(buffered, format="WEBP", lossless=True, quality=0, method=0)
+        return buffered.getvalue()
+
     def update_goals(self, goals: Dict[str, str]):
         """Update current goals.
 
@@ -195,7 +310,9 @@ class GameVisualizer:
         ]
 
         # Broadcast to connected clients
-        if self.running:
+        if self.batched:
+            self._pending_update['goals'] = self.goal_stack
+        elif self._broadcasting:
             self.socketio.emit('goals_update', {'goals': self.goal_stack})
 
     def update_exploration(self, exploration_data: Dict[str, Any]):
@@ -207,9 +324,20 @@ class GameVisualizer:
         self.exploration_data = exploration_data
 
         # Broadcast to connected clients
-        if self.running:
+        if self.batched:
+            self._pending_update['exploration'] = exploration_data
+        elif self._broadcasting:
             self.socketio.emit('exploration_update', exploration_data)
 
+    def flush(self):
+        """Send the batched updates as a single 'turn_update' event."""
+        if not self._pending_update:
+            return
+
+        update, self._pending_update = self._pending_update, {}
+        if self._broadcasting:
+            self.socketio.emit('turn_update', update)
+
     def log_event(self, event_type: str, message: str):
         """Log a special event.
 
@@ -220,7 +348,7 @@ class GameVisualizer:
         event = {
             'type': event_type,
             'message': message,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
 
         # Broadcast to connected clients
@@ -1,7 +1,11 @@
 """Quick test to verify custom API endpoint configuration."""
 
+import hashlib
+import json
 import os
 import sys
+import time
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Set UTF-8 encoding for Windows console
@@ -12,6 +16,12 @@ if sys.platform == "win32":
 # Load environment variables
 load_dotenv()
 
+MODEL = "claude-sonnet-4-5-20250929"
+
+# Successful checks are remembered for a day; pass --force to test anyway
+CACHE_FILE = Path(".cache/custom_api_ok.json")
+CACHE_TTL_SECONDS = 24 * 3600
+
 print("=" * 60)
 print("Custom API Configuration Test")
 print("=" * 60)
@@ -26,6 +36,17 @@ print(f"  API Key: {api_key[:20]}..." if api_key else "  API Key: NOT SET")
 print(f"  Base URL: {base_url}" if base_url else "  Base URL: Using default Anthropic endpoint")
 print()
 
+# Skip the live request if this exact configuration passed recently
+config_key = hashlib.sha256(f"{api_key}|{base_url}|{MODEL}".encode()).hexdigest()
+try:
+    cache = json.loads(CACHE_FILE.read_text())
+except (OSError, ValueError):
+    cache = {}
+
+if "--force" not in sys.argv and time.time() - cache.get(config_key, 0) < CACHE_TTL_SECONDS:
+    print("[OK] Cached: this configuration passed within the last 24 hours (use --force to retest)")
+    sys.exit(0)
+
 # Test API connection
 print("Testing API connection...")
 try:
@@ -40,7 +61,7 @@ try:
 
     print("  Sending test request...")
     response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
+        model=MODEL,
         max_tokens=50,
         messages=[{
             "role": "user",
@@ -49,6 +70,10 @@ try:
     )
 
     print(f"  [OK] Response: {response.content[0].text}")
+
+    cache[config_key] = time.time()
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache))
     print()
     print("=" * 60)
     print("SUCCESS! Your custom API is configured correctly!")
@@ -0,0 +1,45 @@
+"""Tests for ContextManager persistence."""
+
+from src.memory.context_manager import ContextManager
+
+
+def _add_turns(context, start, end):
+    for n in range(start, end):
+        context.add_turn(n, {}, action=f"A{n}", reasoning="r", result="ok")
+
+
+def test_saves_append_to_shared_turn_log(tmp_path):
+    """Two saves append to one turn log instead of rewriting it."""
+    turn_log = str(tmp_path / "context")
+    context = ContextManager(turn_log=turn_log)
+    log_path = tmp_path / "context.turns.jsonl"
+
+    _add_turns(context, 0, 3)
+    context.save(str(tmp_path / "checkpoint_3" / "context.json"))
+    first = log_path.read_bytes()
+
+    _add_turns(context, 3, 5)
+    context.save(str(tmp_path / "checkpoint_5" / "context.json"))
+    second = log_path.read_bytes()
+
+    assert second.startswith(first)
+    assert len(second.splitlines()) == 5
+
+
+def test_checkpoints_load_their_own_turns(tmp_path):
+    """Each checkpoint restores the turns held when it was saved."""
+    turn_log = str(tmp_path / "context")
+    context = ContextManager(turn_log=turn_log)
+
+    _add_turns(context, 0, 3)
+    context.save(str(tmp_path / "checkpoint_3" / "context.json"))
+    _add_turns(context, 3, 5)
+    context.save(str(tmp_path / "checkpoint_5" / "context.json"))
+
+    early = ContextManager(turn_log=turn_log)
+    early.load(str(tmp_path / "checkpoint_3" / "context.json"))
+    assert [t.action for t in early.recent_turns] == ["A0", "A1", "A2"]
+
+    late = ContextManager(turn_log=turn_log)
+    late.load(str(tmp_path / "checkpoint_5" / "context.json"))
+    assert [t.action for t in late.recent_turns] == ["A0", "A1", "A2", "A3", "A4"]
@@ -0,0 +1,41 @@
+"""Tests for MapMemory exploration queries."""
+
+from src.state.map_memory import MapMemory
+
+
+def _baseline_unexplored(explored, x, y, radius):
+    """Reference result: scan the window, then list.sort by distance."""
+    unexplored = []
+    for dx in range(-radius, radius + 1):
+        for dy in range(-radius, radius + 1):
+            pos = (x + dx, y + dy)
+            if pos not in explored and 0 <= pos[0] <= 255 and 0 <= pos[1] <= 255:
+                unexplored.append(pos)
+    unexplored.sort(key=lambda p: abs(p[0] - x) + abs(p[1] - y))
+    return unexplored
+
+
+def test_unexplored_adjacent_keeps_tie_order(tmp_path):
+    """Tiles at equal distance come back in scan order, also when limited."""
+    memory = MapMemory(save_dir=str(tmp_path))
+    explored = {(5, 6), (4, 6), (5, 7)}
+    for x, y in explored:
+        memory.update_position(1, x, y)
+
+    try:
+        expected = _baseline_unexplored(explored, 5, 6, 5)
+        assert memory.get_unexplored_adjacent(1, 5, 6) == expected
+        assert memory.get_unexplored_adjacent(1, 5, 6, limit=10) == expected[:10]
+        assert (6, 5) in memory.get_unexplored_adjacent(1, 5, 6, limit=10)
+    finally:
+        memory.close()
+
+
+def test_unexplored_adjacent_clips_at_map_edge(tmp_path):
+    """Windows reaching past the map edge match the bounds-checked scan."""
+    memory = MapMemory(save_dir=str(tmp_path))
+    try:
+        expected = _baseline_unexplored(set(), 0, 1, 3)
+        assert memory.get_unexplored_adjacent(1, 0, 1, radius=3, limit=5) == expected[:5]
+    finally:
+        memory.close()